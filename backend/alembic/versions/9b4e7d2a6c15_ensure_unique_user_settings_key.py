@@ -0,0 +1,60 @@
+"""ensure user_settings is unique on (user_id, key)
+
+The model and the initial schema both declare uq_user_setting, but a
+pre-Alembic database is stamped at the initial revision rather than built by
+it, so nothing guarantees its user_settings table actually carries the
+constraint. PUT /api/settings now writes with INSERT ... ON CONFLICT(user_id,
+key), which SQLite rejects outright without a unique index on exactly those
+columns.
+
+Where the constraint is missing, duplicate rows may already exist (the old
+SELECT-then-INSERT upsert was racy), so they are collapsed to the most recently
+inserted row before the unique index is created. A no-op on every database
+that already has it, i.e. anything created by Alembic.
+
+Revision ID: 9b4e7d2a6c15
+Revises: c8f1a52d90b7
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = '9b4e7d2a6c15'
+down_revision: Union[str, None] = 'c8f1a52d90b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_COLUMNS = {"user_id", "key"}
+
+
+def _has_unique_user_key(bind) -> bool:
+    inspector = sa.inspect(bind)
+    for uc in inspector.get_unique_constraints("user_settings"):
+        if set(uc["column_names"]) == _COLUMNS:
+            return True
+    for ix in inspector.get_indexes("user_settings"):
+        if ix.get("unique") and set(ix["column_names"]) == _COLUMNS:
+            return True
+    return False
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if _has_unique_user_key(bind):
+        return
+    bind.execute(sa.text(
+        "DELETE FROM user_settings WHERE id NOT IN "
+        "(SELECT MAX(id) FROM user_settings GROUP BY user_id, key)"
+    ))
+    op.create_index("uq_user_setting", "user_settings", ["user_id", "key"], unique=True)
+
+
+def downgrade() -> None:
+    # Nothing to undo: the constraint is part of the schema at every earlier
+    # revision, and this only restored it where it had gone missing.
+    pass
@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -15,6 +16,10 @@ class Settings(BaseSettings):
     # browser directly at the backend (NEXT_PUBLIC_API_URL).
     allowed_origins: str = ""
     template_reload_interval: int = 30  # seconds, 0 to disable
+    # bcrypt cost factor for newly hashed passwords; each step doubles the work.
+    # Existing hashes carry their own cost and keep verifying after a change.
+    # 4 is bcrypt's floor and only sensible for test runs.
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
 
     model_config = {"env_prefix": "", "case_sensitive": False}
 
@@ -12,7 +12,7 @@ from alembic.util import exc as alembic_util_exc
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy import inspect, text
 
@@ -172,6 +172,23 @@ def _run_legacy_migrations(inspector, table_names):
                 logger.info("Legacy migration: added column users.password_changed_at")
 
 
+def _reload_and_sync_templates() -> None:
+    if not reload_if_changed():
+        return
+    db = SessionLocal()
+    try:
+        summary = sync_cards_to_templates(db)
+        if summary["cards_synced"] or summary["cards_initialized"]:
+            logger.info(f"Template hot-reload sync: {summary}")
+    except Exception:
+        # The fingerprint was already advanced by load_templates, so
+        # without this the sync would never be retried.
+        invalidate_fingerprint()
+        raise
+    finally:
+        db.close()
+
+
 async def _template_reload_loop(interval: int) -> None:
     """Background task that periodically checks for template changes and cleans up expired OAuth states."""
     import time as _time
@@ -181,19 +198,9 @@ async def _template_reload_loop(interval: int) -> None:
     while True:
         await asyncio.sleep(interval)
         try:
-            if reload_if_changed():
-                db = SessionLocal()
-                try:
-                    summary = sync_cards_to_templates(db)
-                    if summary["cards_synced"] or summary["cards_initialized"]:
-                        logger.info(f"Template hot-reload sync: {summary}")
-                except Exception:
-                    # The fingerprint was already advanced by load_templates, so
-                    # without this the sync would never be retried.
-                    invalidate_fingerprint()
-                    raise
-                finally:
-                    db.close()
+            # The directory scan, YAML parsing and card sync are all blocking;
+            # run on the event loop they stalled every in-flight request.
+            await asyncio.to_thread(_reload_and_sync_templates)
         except Exception:
             logger.exception("Error during template hot-reload")
 
@@ -295,6 +302,10 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
 
+    # Build the login timing equalizer off the event loop now, so the first
+    # username miss doesn't pay for a bcrypt hash on top of its verify.
+    warm_task = asyncio.create_task(asyncio.to_thread(auth.dummy_password_hash))
+
     # Start background template reload task
     reload_task = None
     if settings.template_reload_interval > 0:
@@ -308,6 +319,7 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await warm_task
     if reload_task:
         reload_task.cancel()
         try:
@@ -316,13 +328,21 @@ async def lifespan(app: FastAPI):
             pass
 
 
-app = FastAPI(title="plan.cards API", version="1.0.0", lifespan=lifespan)
+# orjson renders the encoded response body natively (dates, datetimes, nested
+# dicts) instead of going through the stdlib encoder; card and benefit lists are
+# the bulk of what this API returns.
+app = FastAPI(
+    title="plan.cards API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 app.state.limiter = limiter
 
 
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(status_code=429, content={"detail": "Too many requests. Please try again later."})
+    return ORJSONResponse(status_code=429, content={"detail": "Too many requests. Please try again later."})
 
 
 @app.exception_handler(RequestValidationError)
@@ -341,7 +361,7 @@ async def validation_handler(request: Request, exc: RequestValidationError):
         {"type": err.get("type"), "loc": list(err.get("loc", ())), "msg": err.get("msg", "")}
         for err in exc.errors()
     ]
-    return JSONResponse(status_code=422, content={"detail": safe})
+    return ORJSONResponse(status_code=422, content={"detail": safe})
 
 
 def _cors_kwargs() -> dict:
@@ -421,5 +441,5 @@ def health():
         finally:
             db.close()
     except Exception:
-        return JSONResponse(status_code=503, content={"status": "error", "detail": "Database unreachable"})
+        return ORJSONResponse(status_code=503, content={"status": "error", "detail": "Database unreachable"})
     return {"status": "ok"}
@@ -11,7 +11,7 @@ from fastapi.responses import FileResponse
 from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -21,6 +21,7 @@ from app.models.oauth_provider import OAuthProvider
 from app.models.user import User
 from app.rate_limit import limiter
 from app.routers.auth import require_admin, require_privileged
+from app.schemas.construct import orm_list_response
 from app.schemas.user import UserOut
 from app.services.auth_service import hash_password
 from app.services.crypto import encrypt_value
@@ -78,7 +79,8 @@ def list_users(
     db: Session = Depends(get_db),
     _mode=Depends(_require_multi_user_mode),
 ):
-    return db.query(User).order_by(User.created_at).all()
+    users = db.query(User).order_by(User.created_at).all()
+    return orm_list_response(UserOut, users)
 
 
 @router.post("/users", response_model=UserOut, status_code=201)
@@ -208,9 +210,7 @@ def admin_set_user_password(
 
 @router.get("/config")
 def get_config(admin: User = Depends(require_admin), db: Session = Depends(get_db)):
-    admin_oauth_linked = (
-        db.query(OAuthAccount).filter(OAuthAccount.user_id == admin.id).first() is not None
-    )
+    admin_oauth_linked = db.scalar(select(exists().where(OAuthAccount.user_id == admin.id)))
     return {
         "auth_mode": get_system_config(db, "auth_mode", "open"),
         "registration_enabled": get_system_config(db, "registration_enabled", "true") == "true",
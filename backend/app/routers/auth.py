@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime, timezone
+from functools import cache
 
 import jwt
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
@@ -31,12 +32,24 @@ from app.rate_limit import limiter, login_throttle
 from app.services.bootstrap_token import BOOTSTRAP_TOKEN_HEADER, token_matches
 from app.services.setup_service import get_system_config
 
-# A real bcrypt hash used only to burn the same CPU time on a username miss as
-# on a hit, so response latency stops leaking which accounts exist.
-_DUMMY_PASSWORD_HASH = hash_password("plan.cards-timing-equalizer")
-
 logger = logging.getLogger(__name__)
 
+
+@cache
+def dummy_password_hash() -> str:
+    """A real bcrypt hash used only to burn the same CPU time on a username miss
+    as on a hit, so response latency stops leaking which accounts exist.
+
+    Not built at import: a full bcrypt hash was the single most expensive step
+    of app startup, paid by every worker before it could serve. The lifespan
+    warms it in a background thread instead, so neither startup nor the first
+    username miss (which would otherwise pay a hash *and* a verify, itself a
+    timing tell) waits on it. Built at the configured cost, so it keeps
+    matching real hashes if BCRYPT_ROUNDS changes.
+    """
+    return hash_password("plan.cards-timing-equalizer")
+
+
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 security = HTTPBearer(auto_error=False)
 
@@ -233,7 +246,7 @@ def login(request: Request, response: Response, data: LoginRequest, db: Session
             # Spend the same time as a real verify. Returning immediately made
             # the ~100ms bcrypt cost a reliable username oracle, defeating the
             # identical "Invalid credentials" message.
-            verify_password(data.password, _DUMMY_PASSWORD_HASH)
+            verify_password(data.password, dummy_password_hash())
             login_throttle.record_failure(data.username)
             logger.warning("Failed login attempt for user: %s", data.username)
             raise HTTPException(
@@ -261,12 +274,7 @@ def login(request: Request, response: Response, data: LoginRequest, db: Session
     set_auth_cookie(response, token, request)
     return TokenResponse(
         access_token=token,
-        user=UserBrief(
-            id=user.id,
-            username=user.username,
-            display_name=user.display_name,
-            role=user.role,
-        ),
+        user=UserBrief.from_orm_fast(user),
     )
 
 
@@ -312,12 +320,7 @@ def register(request: Request, response: Response, data: RegisterRequest, db: Se
     set_auth_cookie(response, token, request)
     return TokenResponse(
         access_token=token,
-        user=UserBrief(
-            id=user.id,
-            username=user.username,
-            display_name=user.display_name,
-            role=user.role,
-        ),
+        user=UserBrief.from_orm_fast(user),
     )
 
 
@@ -333,5 +336,5 @@ def verify(user: User = Depends(require_auth)):
     """Verify the current token and return user info."""
     return {
         "status": "ok",
-        "user": UserOut.model_validate(user).model_dump(),
+        "user": UserOut.from_orm_fast(user).model_dump(),
     }
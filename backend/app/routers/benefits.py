@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -30,6 +31,15 @@ router = APIRouter(
     tags=["benefits"],
 )
 
+_BENEFIT_LIST_ADAPTER = TypeAdapter(list[CardBenefitOut])
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[BenefitSummaryItem])
+
+
+# The service builds its results with model_construct; serialize them here so
+# FastAPI does not validate them all over again against `response_model`.
+def _json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(content=content, media_type="application/json", status_code=status_code)
+
 
 def _get_card(card_id: int, user: User, db: Session) -> Card:
     card = (
@@ -57,7 +67,7 @@ def _get_benefit(benefit_id: int, card_id: int, db: Session) -> CardBenefit:
 @router.get("", response_model=list[CardBenefitOut])
 def list_benefits_endpoint(card_id: int, user: User = Depends(require_auth), db: Session = Depends(get_db)):
     card = _get_card(card_id, user, db)
-    return list_benefits(db, card, user_id=user.id)
+    return _json_response(_BENEFIT_LIST_ADAPTER.dump_json(list_benefits(db, card, user_id=user.id)))
 
 
 @router.post("", response_model=CardBenefitOut, status_code=201)
@@ -65,7 +75,7 @@ def create_benefit_endpoint(
     card_id: int, data: CardBenefitCreate, user: User = Depends(require_auth), db: Session = Depends(get_db)
 ):
     card = _get_card(card_id, user, db)
-    return create_benefit(db, card, data, user_id=user.id)
+    return _json_response(create_benefit(db, card, data, user_id=user.id).model_dump_json(), status_code=201)
 
 
 @router.put("/{benefit_id}", response_model=CardBenefitOut)
@@ -74,7 +84,7 @@ def update_benefit_endpoint(
 ):
     card = _get_card(card_id, user, db)
     benefit = _get_benefit(benefit_id, card_id, db)
-    return update_benefit(db, benefit, card, data, user_id=user.id)
+    return _json_response(update_benefit(db, benefit, card, data, user_id=user.id).model_dump_json())
 
 
 @router.delete("/{benefit_id}", status_code=204)
@@ -92,7 +102,7 @@ def update_usage_endpoint(
 ):
     card = _get_card(card_id, user, db)
     benefit = _get_benefit(benefit_id, card_id, db)
-    return update_usage(db, benefit, card, data, user_id=user.id)
+    return _json_response(update_usage(db, benefit, card, data, user_id=user.id).model_dump_json())
 
 
 @router.post("/populate", response_model=list[CardBenefitOut])
@@ -131,7 +141,7 @@ def populate_benefits_endpoint(card_id: int, user: User = Depends(require_auth),
             for t in template.benefits.spend_thresholds
         ]
         results.extend(populate_from_template(db, card, thresholds, user_id=user.id))
-    return results
+    return _json_response(_BENEFIT_LIST_ADAPTER.dump_json(results))
 
 
 # Summary router — bulk benefits across all cards
@@ -147,4 +157,4 @@ def list_all_benefits_endpoint(
     user: User = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
-    return list_all_benefits(db, profile_id, user_id=user.id)
+    return _json_response(_SUMMARY_LIST_ADAPTER.dump_json(list_all_benefits(db, profile_id, user_id=user.id)))
@@ -2,8 +2,9 @@ import mimetypes
 from datetime import datetime, timezone
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import FileResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.database import get_db
@@ -22,6 +23,27 @@ from app.services.template_loader import (
 
 router = APIRouter(prefix="/api/cards", tags=["cards"])
 
+_CARD_LIST_ADAPTER = TypeAdapter(list[CardOut])
+
+
+# Card responses are built with CardOut.from_orm_fast and serialized here rather
+# than returned as ORM objects: FastAPI would otherwise re-validate every field
+# of every card, event and bonus against `response_model` on the way out. The
+# decorators keep `response_model` for the OpenAPI schema.
+def _card_response(card: Card, status_code: int = 200) -> Response:
+    return Response(
+        content=CardOut.from_orm_fast(card).model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def _card_list_response(cards: list[Card]) -> Response:
+    return Response(
+        content=_CARD_LIST_ADAPTER.dump_json([CardOut.from_orm_fast(c) for c in cards]),
+        media_type="application/json",
+    )
+
 
 def _verify_card_ownership(db: Session, user: User, card_id: int, include_deleted: bool = False) -> Card:
     """Load a card and verify it belongs to the user via its profile."""
@@ -61,7 +83,7 @@ def list_cards(
         query = query.filter(Card.card_type == card_type)
     if issuer is not None:
         query = query.filter(Card.issuer == issuer)
-    return query.order_by(Card.open_date.desc().nullslast()).all()
+    return _card_list_response(query.order_by(Card.open_date.desc().nullslast()).all())
 
 
 @router.post("", response_model=CardOut, status_code=201)
@@ -73,7 +95,7 @@ def create_card_endpoint(request: Request, data: CardCreate, user: User = Depend
         raise HTTPException(status_code=404, detail="Profile not found")
     card = create_card(db, data, user_id=user.id)
     db.refresh(card, ["events", "bonuses"])
-    return card
+    return _card_response(card, status_code=201)
 
 
 @router.get("/{card_id}", response_model=CardOut)
@@ -87,7 +109,7 @@ def get_card(card_id: int, user: User = Depends(require_auth), db: Session = Dep
     )
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
-    return card
+    return _card_response(card)
 
 
 @router.put("/{card_id}", response_model=CardOut)
@@ -99,7 +121,7 @@ def update_card_endpoint(request: Request, card_id: int, data: CardUpdate, user:
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     db.refresh(card, ["events", "bonuses"])
-    return card
+    return _card_response(card)
 
 
 @router.delete("/{card_id}", status_code=204)
@@ -118,7 +140,7 @@ def restore_card(card_id: int, user: User = Depends(require_auth), db: Session =
     card.deleted_at = None
     db.commit()
     db.refresh(card, ["events", "bonuses"])
-    return card
+    return _card_response(card)
 
 
 @router.post("/{card_id}/close", response_model=CardOut)
@@ -129,7 +151,7 @@ def close_card_endpoint(card_id: int, data: CloseCardRequest, user: User = Depen
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     db.refresh(card, ["events", "bonuses"])
-    return card
+    return _card_response(card)
 
 
 @router.post("/{card_id}/reopen", response_model=CardOut)
@@ -140,7 +162,7 @@ def reopen_card_endpoint(card_id: int, user: User = Depends(require_auth), db: S
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     db.refresh(card, ["events", "bonuses"])
-    return card
+    return _card_response(card)
 
 
 @router.post("/{card_id}/product-change", response_model=CardOut)
@@ -167,7 +189,7 @@ def product_change_endpoint(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     db.refresh(card, ["events", "bonuses"])
-    return card
+    return _card_response(card)
 
 
 @router.get("/{card_id}/image")
@@ -417,10 +417,5 @@ async def token_exchange(
     set_auth_cookie(response, token, request)
     return TokenResponse(
         access_token=token,
-        user=UserBrief(
-            id=user.id,
-            username=user.username,
-            display_name=user.display_name,
-            role=user.role,
-        ),
+        user=UserBrief.from_orm_fast(user),
     )
@@ -1,6 +1,8 @@
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -8,9 +10,10 @@ from app.database import get_db
 from app.models.profile import Profile
 from app.models.user import User
 from app.routers.auth import require_auth
-from app.schemas.export_import import ExportData, ImportResult
+from app.schemas.construct import orm_list_response
+from app.schemas.export_import import EXPORT_DATA_ADAPTER, ExportData, ImportResult
 from app.schemas.profile import ProfileCreate, ProfileUpdate, ProfileOut
-from app.services.export_import import export_profiles, import_profiles
+from app.services.export_import import export_profiles_json, import_profiles
 from app.services.five_twenty_four import get_524_details
 from app.services.template_sync import sync_cards_to_templates
 
@@ -21,7 +24,8 @@ router = APIRouter(prefix="/api/profiles", tags=["profiles"])
 
 @router.get("", response_model=list[ProfileOut])
 def list_profiles(user: User = Depends(require_auth), db: Session = Depends(get_db)):
-    return db.query(Profile).filter(Profile.user_id == user.id).order_by(Profile.name).all()
+    profiles = db.query(Profile).filter(Profile.user_id == user.id).order_by(Profile.name).all()
+    return orm_list_response(ProfileOut, profiles)
 
 
 @router.post("", response_model=ProfileOut, status_code=201)
@@ -54,13 +58,41 @@ def export_profiles_endpoint(
         profile = db.get(Profile, profile_id)
         if not profile or profile.user_id != user.id:
             raise HTTPException(status_code=404, detail="Profile not found")
-    return export_profiles(db, profile_id, user_id=user.id)
+    # Already-serialized JSON; `response_model` only documents the shape.
+    return Response(content=export_profiles_json(db, profile_id, user_id=user.id), media_type="application/json")
 
 
-@router.post("/import", response_model=ImportResult)
+async def _read_capped_body(request: Request, limit: int) -> bytearray:
+    """Read the request body, giving up with 413 as soon as it passes `limit`.
+
+    Content-Length is optional (chunked uploads) and can lie, so the cap is
+    enforced on the bytes as they arrive: an oversized upload costs at most
+    `limit` bytes of memory instead of being buffered whole and then rejected.
+    """
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise HTTPException(status_code=413, detail="Import file too large (max 50MB)")
+    return body
+
+
+# The body is read and validated by hand rather than declared as an ExportData
+# parameter: EXPORT_DATA_ADAPTER.validate_json parses the raw bytes in one pass,
+# and the size limits are enforced before any parsing happens at all.
+# openapi_extra keeps the documented request body.
+@router.post(
+    "/import",
+    response_model=ImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/ExportData"}}},
+        },
+    },
+)
 async def import_profiles_endpoint(
     request: Request,
-    data: ExportData,
     mode: Literal["new", "override", "merge"] = Query("new"),
     target_profile_id: int | None = Query(None),
     user: User = Depends(require_auth),
@@ -73,6 +105,14 @@ async def import_profiles_endpoint(
             raise HTTPException(status_code=413, detail="Import file too large (max 50MB)")
     except ValueError:
         pass
+    body = await _read_capped_body(request, MAX_IMPORT_SIZE)
+    try:
+        data: ExportData = EXPORT_DATA_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        # Same 422 shape as a declared body parameter, `loc` rooted at "body".
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+        )
     if mode in ("override", "merge") and target_profile_id is None:
         raise HTTPException(status_code=400, detail=f"{mode} mode requires target_profile_id")
     if target_profile_id is not None:
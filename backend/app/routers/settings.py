@@ -1,13 +1,15 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.setting import Setting
 from app.models.user import User
 from app.models.user_setting import UserSetting
-from app.utils.timezone import resolve_timezone
+from app.utils.timezone import forget_timezones, resolve_timezone
 from app.routers.auth import require_auth
 from app.schemas.settings import SettingsUpdate
 
@@ -15,25 +17,18 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 
 def _upsert_setting(db: Session, user_id: int, key: str, value: str) -> None:
-    setting = (
-        db.query(UserSetting)
-        .filter(UserSetting.user_id == user_id, UserSetting.key == key)
-        .first()
-    )
-    if setting:
-        setting.value = value
-    else:
-        db.add(UserSetting(user_id=user_id, key=key, value=value))
+    # One indexed write against uq_user_setting instead of SELECT-then-INSERT.
+    stmt = sqlite_insert(UserSetting).values(user_id=user_id, key=key, value=value)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[UserSetting.user_id, UserSetting.key],
+        set_={"value": stmt.excluded.value},
+    ))
 
 
 def _delete_setting(db: Session, user_id: int, key: str) -> None:
-    setting = (
-        db.query(UserSetting)
-        .filter(UserSetting.user_id == user_id, UserSetting.key == key)
-        .first()
-    )
-    if setting:
-        db.delete(setting)
+    db.query(UserSetting).filter(
+        UserSetting.user_id == user_id, UserSetting.key == key
+    ).delete()
 
 
 def _get_server_timezone(db: Session) -> str:
@@ -51,8 +46,9 @@ def _get_server_timezone(db: Session) -> str:
 
 @router.get("")
 def get_settings(user: User = Depends(require_auth), db: Session = Depends(get_db)):
-    settings = db.query(UserSetting).filter(UserSetting.user_id == user.id).all()
-    result = {s.key: s.value for s in settings}
+    result = dict(db.execute(
+        select(UserSetting.key, UserSetting.value).where(UserSetting.user_id == user.id)
+    ).all())
     result["server_timezone"] = _get_server_timezone(db)
     return result
 
@@ -66,5 +62,6 @@ def update_settings(data: SettingsUpdate, user: User = Depends(require_auth), db
             if resolve_timezone(data.timezone) is None:
                 raise HTTPException(status_code=400, detail="Invalid timezone")
             _upsert_setting(db, user.id, "timezone", data.timezone)
+        forget_timezones(db)
     db.commit()
     return get_settings(user, db)
@@ -1,40 +1,96 @@
 import mimetypes
+import os
+from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import FileResponse
 
 from app.schemas.template import CardTemplateOut, TemplateVersionDetail, TemplateVersionSummary
 from app.services.template_loader import (
-    get_all_templates,
     get_old_version,
     get_placeholder_image_path,
     get_template,
     get_template_image_path,
     get_template_image_path_by_filename,
     get_template_versions,
-    get_templates_by_issuer,
+    get_templates_json,
 )
 
+# The catalog handlers only read in-memory state, so they are `async def`: a
+# plain `def` would be dispatched to the threadpool with no blocking work to
+# offload. The image handlers stat/resolve files on the templates directory
+# (often a bind mount), so they stay plain `def` and run in the threadpool.
 router = APIRouter(prefix="/api/templates", tags=["templates"])
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers `etag` (RFC 9110 weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
+
+
 @router.get("", response_model=list[CardTemplateOut])
-def list_templates(issuer: str | None = None):
-    if issuer:
-        return get_templates_by_issuer(issuer)
-    return get_all_templates()
+async def list_templates(request: Request, issuer: str | None = None):
+    # Served from the bytes serialized at load time. `response_model` stays for
+    # the OpenAPI schema; returning a Response bypasses re-serialization.
+    # `no-cache`, not a max-age: a hot reload changes the catalog at the same
+    # URL, and revalidating through the ETag/304 path below is cheap.
+    body, etag = get_templates_json(issuer)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _image_response(request: Request, image_path: Path, not_found: str) -> Response:
+    """Serve a template image with validators and byte-range support.
+
+    FileResponse already answers `Range` requests with 206 and advertises
+    `Accept-Ranges: bytes`; what it does not do is honour `If-None-Match`, so
+    every revalidation re-sent the whole image. Stat once up front so the ETag
+    is known before deciding between a 304 and the file.
+
+    `no-cache` rather than a max-age: a hot reload can replace an image in
+    place at the same URL, so browsers must revalidate every time (cheap, via
+    the 304 path) instead of showing the old image until the max-age expires.
+    Called from sync handlers, so the stat runs in the threadpool.
+    """
+    try:
+        stat_result = os.stat(image_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail=not_found)
+    media_type = mimetypes.guess_type(str(image_path))[0] or "image/png"
+    response = FileResponse(
+        image_path,
+        media_type=media_type,
+        stat_result=stat_result,
+        headers={"Cache-Control": "no-cache"},
+    )
+    etag = response.headers["etag"]
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": response.headers["cache-control"]},
+        )
+    return response
 
 
 @router.get("/placeholder-image")
-def get_placeholder_image():
+def get_placeholder_image(request: Request):
     image_path = get_placeholder_image_path()
     if not image_path:
         raise HTTPException(status_code=404, detail="Placeholder image not found")
-    return FileResponse(image_path, media_type="image/png")
+    return _image_response(request, image_path, "Placeholder image not found")
 
 
 @router.get("/{issuer}/{card_name}", response_model=CardTemplateOut)
-def get_template_endpoint(issuer: str, card_name: str):
+async def get_template_endpoint(issuer: str, card_name: str):
     template = get_template(f"{issuer}/{card_name}")
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -42,28 +98,26 @@ def get_template_endpoint(issuer: str, card_name: str):
 
 
 @router.get("/{issuer}/{card_name}/image")
-def get_template_image(issuer: str, card_name: str):
+def get_template_image(request: Request, issuer: str, card_name: str):
     image_path = get_template_image_path(f"{issuer}/{card_name}")
     if not image_path:
         raise HTTPException(status_code=404, detail="Image not found")
-    media_type = mimetypes.guess_type(str(image_path))[0] or "image/png"
-    return FileResponse(image_path, media_type=media_type)
+    return _image_response(request, image_path, "Image not found")
 
 
 @router.get("/{issuer}/{card_name}/image/{filename}")
-def get_template_image_variant(issuer: str, card_name: str, filename: str):
+def get_template_image_variant(request: Request, issuer: str, card_name: str, filename: str):
     image_path = get_template_image_path_by_filename(f"{issuer}/{card_name}", filename)
     if not image_path:
         raise HTTPException(status_code=404, detail="Image variant not found")
-    media_type = mimetypes.guess_type(str(image_path))[0] or "image/png"
-    return FileResponse(image_path, media_type=media_type)
+    return _image_response(request, image_path, "Image variant not found")
 
 
 @router.get(
     "/{issuer}/{card_name}/versions",
     response_model=list[TemplateVersionSummary],
 )
-def list_template_versions(issuer: str, card_name: str):
+async def list_template_versions(issuer: str, card_name: str):
     template_id = f"{issuer}/{card_name}"
     template = get_template(template_id)
     if not template:
@@ -75,7 +129,7 @@ def list_template_versions(issuer: str, card_name: str):
     "/{issuer}/{card_name}/versions/{version_id}",
     response_model=TemplateVersionDetail,
 )
-def get_template_version(issuer: str, card_name: str, version_id: str):
+async def get_template_version(issuer: str, card_name: str, version_id: str):
     template_id = f"{issuer}/{card_name}"
     template = get_template(template_id)
     if not template:
@@ -1,5 +1,6 @@
 import logging
 import time
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, Field
@@ -11,13 +12,14 @@ from app.models.oauth_account import OAuthAccount
 from app.models.oauth_provider import OAuthProvider
 from app.models.user import User
 from app.routers.auth import require_auth
+from app.schemas.construct import orm_response
 from app.schemas.user import UserOut
 from app.rate_limit import limiter
-from app.services.auth_service import hash_password, verify_password
+from app.services.auth_service import create_access_token, hash_password, set_auth_cookie, verify_password
 from app.services.crypto import encrypt_value
 from app.services.oauth_service import exchange_code, extract_user_info, MissingSubjectError
 from app.services.crypto import DecryptionError
-from app.services.setup_service import get_system_config
+from app.services.setup_service import get_system_config, set_system_config
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +37,9 @@ class ChangePasswordRequest(BaseModel):
 
 
 @router.get("/me", response_model=UserOut)
-def get_current_user(user: User = Depends(require_auth)):
-    return user
+async def get_current_user(user: User = Depends(require_auth)):
+    # No I/O of its own (require_auth does the lookup), so skip the threadpool.
+    return orm_response(UserOut, user)
 
 
 @router.put("/me", response_model=UserOut)
@@ -67,11 +70,6 @@ def change_password(
     user: User = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
-    from datetime import datetime, timezone
-    from app.services.auth_service import create_access_token, set_auth_cookie
-
-    from app.services.setup_service import get_system_config, set_system_config
-
     auth_mode = get_system_config(db, "auth_mode", "open")
 
     if auth_mode == "single_password":
@@ -203,11 +201,10 @@ def user_unlink_oauth(
     db: Session = Depends(get_db),
 ):
     """Unlink an OAuth account from the current user."""
-    account = (
-        db.query(OAuthAccount)
-        .filter(OAuthAccount.user_id == user.id, OAuthAccount.provider == provider_name)
-        .first()
-    )
+    # One query for all of the user's links: the target is picked out of it and
+    # its length is the lockout count, instead of a lookup plus a COUNT(*).
+    accounts = db.query(OAuthAccount).filter(OAuthAccount.user_id == user.id).all()
+    account = next((a for a in accounts if a.provider == provider_name), None)
     if not account:
         raise HTTPException(status_code=404, detail="OAuth account not found")
 
@@ -215,8 +212,7 @@ def user_unlink_oauth(
     # In OAuth mode, password login is disabled so password_hash doesn't help.
     auth_mode = get_system_config(db, "auth_mode", "open")
     if auth_mode == "multi_user_oauth" or not user.password_hash:
-        oauth_count = db.query(OAuthAccount).filter(OAuthAccount.user_id == user.id).count()
-        if oauth_count <= 1:
+        if len(accounts) <= 1:
             raise HTTPException(
                 status_code=400,
                 detail="Cannot unlink your only OAuth account",
@@ -5,11 +5,38 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.schemas.card_event import CardEventOut
 from app.schemas.card_bonus import CardBonusOut
+from app.schemas.construct import construct_from_orm
 
 CardType = Literal["personal", "business"]
 CardStatus = Literal["active", "closed"]
 
 
+def clean_custom_tags(v: list[str] | None) -> list[str] | None:
+    """Strip tags, drop empties and case-insensitive duplicates; None if nothing is left."""
+    if v is None:
+        return v
+    if len(v) > 20:
+        raise ValueError("Maximum 20 tags allowed")
+    # Most writes resend the card's stored tags, which are already clean: hand
+    # the list back as-is instead of rebuilding it.
+    if v and all(tag and len(tag) <= 50 and tag == tag.strip() for tag in v) \
+            and len({tag.lower() for tag in v}) == len(v):
+        return v
+    seen: set[str] = set()
+    cleaned = []
+    for tag in v:
+        tag = tag.strip()
+        if not tag:
+            continue
+        if len(tag) > 50:
+            raise ValueError("Each tag must be 50 characters or less")
+        lower = tag.lower()
+        if lower not in seen:
+            seen.add(lower)
+            cleaned.append(tag)
+    return cleaned or None
+
+
 class CardCreate(BaseModel):
     profile_id: int
     template_id: str | None = None
@@ -48,23 +75,7 @@ class CardCreate(BaseModel):
     @field_validator("custom_tags")
     @classmethod
     def validate_custom_tags(cls, v: list[str] | None) -> list[str] | None:
-        if v is not None:
-            if len(v) > 20:
-                raise ValueError("Maximum 20 tags allowed")
-            seen: set[str] = set()
-            cleaned = []
-            for tag in v:
-                tag = tag.strip()
-                if not tag:
-                    continue
-                if len(tag) > 50:
-                    raise ValueError("Each tag must be 50 characters or less")
-                lower = tag.lower()
-                if lower not in seen:
-                    seen.add(lower)
-                    cleaned.append(tag)
-            return cleaned or None
-        return v
+        return clean_custom_tags(v)
 
     @model_validator(mode="after")
     def validate_dates(self) -> "CardCreate":
@@ -136,23 +147,7 @@ class CardUpdate(BaseModel):
     @field_validator("custom_tags")
     @classmethod
     def validate_custom_tags(cls, v: list[str] | None) -> list[str] | None:
-        if v is not None:
-            if len(v) > 20:
-                raise ValueError("Maximum 20 tags allowed")
-            seen: set[str] = set()
-            cleaned = []
-            for tag in v:
-                tag = tag.strip()
-                if not tag:
-                    continue
-                if len(tag) > 50:
-                    raise ValueError("Each tag must be 50 characters or less")
-                lower = tag.lower()
-                if lower not in seen:
-                    seen.add(lower)
-                    cleaned.append(tag)
-            return cleaned or None
-        return v
+        return clean_custom_tags(v)
 
     @model_validator(mode="after")
     def validate_dates(self) -> "CardUpdate":
@@ -217,3 +212,13 @@ class CardOut(BaseModel):
     bonuses: list[CardBonusOut] = []
 
     model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_orm_fast(cls, card) -> "CardOut":
+        """Unvalidated build from a Card row and its loaded events/bonuses."""
+        return construct_from_orm(
+            cls,
+            card,
+            events=[construct_from_orm(CardEventOut, e) for e in card.events],
+            bonuses=[construct_from_orm(CardBonusOut, b) for b in card.bonuses],
+        )
@@ -0,0 +1,51 @@
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def construct_from_orm(model: type[M], obj: Any, **overrides: Any) -> M:
+    """Build a response model from an ORM row WITHOUT running validation.
+
+    `from_attributes` validation re-checks every field of every row, which for
+    list endpoints is most of the response cost. Rows read back from the
+    database already have the column types the Out schemas declare, so the
+    trusted read path can skip it. Never use this on client input.
+
+    Only the model's declared fields are copied, so the Out schema stays the
+    allowlist of what reaches the client. Nested models must be built by the
+    caller and passed in `overrides`.
+    """
+    values = {name: getattr(obj, name) for name in model.model_fields if name not in overrides}
+    values.update(overrides)
+    return model.model_construct(**values)
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+# The responses below are serialized here rather than returned as ORM objects:
+# FastAPI would otherwise validate every row against the endpoint's
+# `response_model` on the way out. Endpoints keep `response_model` for the
+# OpenAPI schema. Flat schemas only; nested ones need their own from_orm_fast.
+def orm_response(model: type[BaseModel], obj: Any, status_code: int = 200) -> Response:
+    """JSON response for one ORM row, built with construct_from_orm."""
+    return Response(
+        content=construct_from_orm(model, obj).model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def orm_list_response(model: type[BaseModel], rows: Iterable[Any]) -> Response:
+    """JSON array response for ORM rows, built with construct_from_orm."""
+    return Response(
+        content=_list_adapter(model).dump_json([construct_from_orm(model, row) for row in rows]),
+        media_type="application/json",
+    )
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 class ExportEvent(BaseModel):
@@ -80,8 +80,8 @@ class ExportCard(BaseModel):
     signup_bonus_type: str | None = None
     signup_bonus_earned: bool = False
     # Bounded like `profiles` and `cards` are: without a cap, one card can carry
-    # an unbounded number of rows through validation and into a flush-per-row
-    # insert loop.
+    # an unbounded number of rows through validation and into the import's
+    # bulk INSERT statements, whose parameter lists grow with every row.
     events: list[ExportEvent] = Field(default=[], max_length=2000)
     benefits: list[ExportBenefit] = Field(default=[], max_length=200)
     bonuses: list[ExportBonus] = Field(default=[], max_length=200)
@@ -107,6 +107,12 @@ class ExportData(BaseModel):
         return v
 
 
+# Built once at import time. The import endpoint validates the raw request
+# bytes with validate_json, which parses and validates a multi-megabyte export
+# in one pass instead of materialising a json.loads() tree first.
+EXPORT_DATA_ADAPTER = TypeAdapter(ExportData)
+
+
 class ImportResult(BaseModel):
     profiles_imported: int = 0
     cards_imported: int = 0
@@ -2,6 +2,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, EmailStr, Field
 
+from app.schemas.construct import construct_from_orm
+
 
 class UserOut(BaseModel):
     id: int
@@ -15,6 +17,11 @@ class UserOut(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_fast(cls, user) -> "UserOut":
+        """Unvalidated build from a User row."""
+        return construct_from_orm(cls, user)
+
 
 class UserBrief(BaseModel):
     id: int
@@ -24,6 +31,11 @@ class UserBrief(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_fast(cls, user) -> "UserBrief":
+        """Unvalidated build from a User row."""
+        return construct_from_orm(cls, user)
+
 
 class RegisterRequest(BaseModel):
     username: str = Field(min_length=1, max_length=100)
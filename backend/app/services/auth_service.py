@@ -1,7 +1,12 @@
+import base64
+import hashlib
+import hmac
+import time
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
 import jwt
+import orjson
 from fastapi import Request, Response
 
 from app.config import settings
@@ -59,7 +64,7 @@ def _bcrypt_bytes(password: str) -> bytes:
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(_bcrypt_bytes(password), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(_bcrypt_bytes(password), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode()
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -70,15 +75,79 @@ def verify_password(plain: str, hashed: str) -> bool:
         return False
 
 
+# Tokens are HS256 only, so they are signed and checked here directly rather
+# than through jwt.encode/jwt.decode: every authenticated request decodes one,
+# and PyJWT's generic path (algorithm registry, stdlib json, option handling)
+# costs several times the HMAC itself. The wire format is unchanged — tokens
+# minted either way verify either way — and failures still raise PyJWT's
+# exception types, which is what callers catch.
+_JWT_HEADER = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _sign(signing_input: bytes) -> bytes:
+    return hmac.new(settings.secret_key.encode(), signing_input, hashlib.sha256).digest()
+
+
 def create_access_token(user_id: int, role: str, password_changed_at: datetime | None = None) -> str:
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=settings.access_token_expire_minutes)
-    payload: dict = {"sub": str(user_id), "role": role, "exp": expire, "iat": now}
+    payload: dict = {
+        "sub": str(user_id),
+        "role": role,
+        "exp": int(expire.timestamp()),
+        "iat": int(now.timestamp()),
+    }
     if password_changed_at:
         payload["pwd_ts"] = int(password_changed_at.timestamp())
-    return jwt.encode(payload, settings.secret_key, algorithm=ALGORITHM)
+    signing_input = _JWT_HEADER + b"." + base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    signature = base64.urlsafe_b64encode(_sign(signing_input)).rstrip(b"=")
+    return (signing_input + b"." + signature).decode()
 
 
 def decode_token(token: str) -> dict:
-    """Decode and validate a JWT token. Raises jwt.PyJWTError on failure."""
-    return jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+    """Decode and validate a JWT token. Raises jwt.PyJWTError on failure.
+
+    Only HS256 is accepted, whatever the header claims, and `exp` is required.
+    `iat` and `nbf`, when present, must not be in the future.
+    """
+    try:
+        if token.count(".") != 2:
+            raise ValueError
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = orjson.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+    except ValueError:
+        # Covers bad base64, bad JSON and non-ASCII input alike.
+        raise jwt.DecodeError("Invalid token") from None
+    if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    signing_input = f"{header_b64}.{payload_b64}".encode()
+    if not hmac.compare_digest(signature, _sign(signing_input)):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError:
+        raise jwt.DecodeError("Invalid payload") from None
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload")
+
+    now = time.time()
+    if "exp" not in payload:
+        raise jwt.MissingRequiredClaimError("exp")
+    try:
+        exp = int(payload["exp"])
+        iat = int(payload["iat"]) if "iat" in payload else None
+        nbf = int(payload["nbf"]) if "nbf" in payload else None
+    except (TypeError, ValueError):
+        raise jwt.DecodeError("Time claims must be integers") from None
+    if exp <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    if (iat is not None and iat > now) or (nbf is not None and nbf > now):
+        raise jwt.ImmatureSignatureError("The token is not yet valid")
+    return payload
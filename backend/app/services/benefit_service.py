@@ -1,5 +1,9 @@
+from collections import defaultdict
 from datetime import date
+from functools import lru_cache
+from itertools import repeat
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 from app.models.card import Card
@@ -15,9 +19,22 @@ from app.schemas.card_benefit import (
 from app.utils.period_utils import get_current_period, period_end_for_start
 from app.utils.timezone import get_today
 
+# Responses here are built with model_construct, skipping pydantic validation:
+# every value comes from an ORM column or is computed below, never from the
+# client, so re-checking each field of each benefit is pure overhead on the
+# list endpoints.
 
-def _refresh_period(benefit: CardBenefit, card_open_date: date | None, today: date) -> None:
-    """Re-anchor the benefit to the current period, resetting usage if it lapsed.
+
+def _plan_refresh(
+    benefit, card_open_date: date | None, today: date
+) -> tuple[tuple[date, date], bool | None]:
+    """Work out how to re-anchor the benefit to the current period, without touching it.
+
+    `benefit` is anything with CardBenefit's frequency, reset_type, retired
+    and period_start attributes — an ORM row or a plain column Row. Returns
+    the current (period_start, period_end) and what has to change: None if the
+    stored period is current, False if only period_start moves, True if
+    amount_used must also reset to 0.
 
     `today` MUST be the user's timezone-local date. Using the server's date
     rolls the period over at UTC midnight, which for a Los Angeles user wipes
@@ -33,39 +50,62 @@ def _refresh_period(benefit: CardBenefit, card_open_date: date | None, today: da
     (the anchor shifted within the same window) and resets if it does not (a
     genuine rollover, or a move to an unrelated period).
     """
-    if benefit.retired:
-        return
-    period_start, _ = get_current_period(
-        benefit.frequency, benefit.reset_type, card_open_date, today
-    )
-    if benefit.period_start == period_start:
-        return
+    period = get_current_period(benefit.frequency, benefit.reset_type, card_open_date, today)
+    period_start = period[0]
+    if benefit.retired or benefit.period_start == period_start:
+        return period, None
 
     if benefit.period_start is not None:
         old_end = period_end_for_start(benefit.frequency, benefit.period_start)
         if old_end >= period_start:
             # Overlapping window — keep what the user recorded.
-            benefit.period_start = period_start
-            return
-
-    benefit.amount_used = 0
-    benefit.period_start = period_start
+            return period, False
+
+    return period, True
+
+
+def _refresh_period(benefit: CardBenefit, card_open_date: date | None, today: date) -> tuple[date, date]:
+    """Apply _plan_refresh to an ORM row and return the current period, so
+    callers can hand it to _benefit_to_out instead of computing it again."""
+    period, reset = _plan_refresh(benefit, card_open_date, today)
+    if reset is not None:
+        benefit.period_start = period[0]
+        if reset:
+            benefit.amount_used = 0
+    return period
+
+
+def _apply_refreshes(db: Session, stale: dict[tuple[date, bool], list[int]]) -> None:
+    """Persist planned refreshes with one UPDATE per (new period_start, reset) group."""
+    for (period_start, reset), ids in stale.items():
+        values = {"period_start": period_start}
+        if reset:
+            values["amount_used"] = 0
+        db.execute(update(CardBenefit).where(CardBenefit.id.in_(ids)).values(**values))
+
+
+def _benefit_to_out(
+    benefit: CardBenefit,
+    period_start: date,
+    period_end: date,
+    today: date,
+    model: type[CardBenefitOut] = CardBenefitOut,
+    **extra,
+) -> CardBenefitOut:
+    """Convert model to response with computed fields.
 
+    The period MUST have been computed for the same `today`; mixing a
+    server-date period with a user-date "today" produced "Resets Mar 31 · 0d
+    left" on Apr 1.
 
-def _benefit_to_out(benefit: CardBenefit, card_open_date: date | None, today: date | None = None) -> CardBenefitOut:
-    """Convert model to response with computed fields."""
-    if today is None:
-        today = date.today()
-    # Same `today` drives the period and the countdown; mixing a server-date
-    # period with a user-date "today" produced "Resets Mar 31 · 0d left" on Apr 1.
-    period_start, period_end = get_current_period(
-        benefit.frequency, benefit.reset_type, card_open_date, today
-    )
+    `model` and `extra` let subclasses such as BenefitSummaryItem be built in
+    one step, without an intermediate CardBenefitOut per row.
+    """
     days_until_reset = (period_end - today).days + 1 if period_end >= today else 0
 
     reset_label = _make_reset_label(period_end, benefit.reset_type)
 
-    return CardBenefitOut(
+    return model.model_construct(
         id=benefit.id,
         card_id=benefit.card_id,
         benefit_name=benefit.benefit_name,
@@ -84,28 +124,73 @@ def _benefit_to_out(benefit: CardBenefit, card_open_date: date | None, today: da
         days_until_reset=days_until_reset,
         reset_label=reset_label,
         created_at=benefit.created_at,
+        **extra,
+    )
+
+
+def _summary_item(row, period_start: date, period_end: date, today: date) -> BenefitSummaryItem:
+    """Render a list_all_benefits row, which carries its card and profile columns."""
+    return _benefit_to_out(
+        row, period_start, period_end, today,
+        model=BenefitSummaryItem,
+        card_name=row.card_name,
+        issuer=row.issuer,
+        last_digits=row.last_digits,
+        template_id=row.template_id,
+        card_image=row.card_image,
+        profile_id=row.profile_id,
+        profile_name=row.profile_name,
     )
 
 
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+# Built by hand rather than with strftime("%b %-d"): `%-d` is a glibc extension
+# that Windows rejects, and `%b` follows the process locale. Cached
+# because a list response repeats the same few period ends across its rows.
+@lru_cache(maxsize=512)
 def _make_reset_label(period_end: date, reset_type: str) -> str:
-    label = f"Resets {period_end.strftime('%b %-d')}"
+    label = f"Resets {_MONTH_ABBR[period_end.month - 1]} {period_end.day}"
     if reset_type == "cardiversary":
         label += " (cardiversary)"
     return label
 
 
+def _refreshed_outs(
+    db: Session, benefits, open_dates, today: date, render=_benefit_to_out
+) -> list[CardBenefitOut]:
+    """Render each benefit for its current period, persisting lapsed ones in bulk.
+
+    Read endpoints rarely find anything stale, so instead of dirtying every
+    row and flushing one UPDATE apiece, refreshes are grouped for
+    _apply_refreshes and the commit is skipped entirely when there are none.
+    """
+    outs = []
+    stale: dict[tuple[date, bool], list[int]] = defaultdict(list)
+    for benefit, open_date in zip(benefits, open_dates):
+        period, reset = _plan_refresh(benefit, open_date, today)
+        out = render(benefit, *period, today)
+        if reset is not None:
+            stale[(period[0], reset)].append(benefit.id)
+            if reset:
+                out.amount_used = 0
+        outs.append(out)
+    if stale:
+        _apply_refreshes(db, stale)
+        db.commit()
+    return outs
+
+
 def list_benefits(db: Session, card: Card, user_id: int | None = None) -> list[CardBenefitOut]:
     benefits = db.query(CardBenefit).filter(CardBenefit.card_id == card.id).all()
     today = get_today(db, user_id)
-    for b in benefits:
-        _refresh_period(b, card.open_date, today)
-    db.commit()
-    return [_benefit_to_out(b, card.open_date, today) for b in benefits]
+    return _refreshed_outs(db, benefits, repeat(card.open_date), today)
 
 
 def create_benefit(db: Session, card: Card, data: CardBenefitCreate, user_id: int | None = None) -> CardBenefitOut:
     today = get_today(db, user_id)
-    period_start, _ = get_current_period(
+    period_start, period_end = get_current_period(
         data.frequency, data.reset_type, card.open_date, today
     )
     benefit = CardBenefit(
@@ -122,7 +207,7 @@ def create_benefit(db: Session, card: Card, data: CardBenefitCreate, user_id: in
     db.add(benefit)
     db.commit()
     db.refresh(benefit)
-    return _benefit_to_out(benefit, card.open_date, today)
+    return _benefit_to_out(benefit, period_start, period_end, today)
 
 
 def update_benefit(
@@ -141,17 +226,17 @@ def update_benefit(
     if update_data:
         benefit.user_modified = True
 
+    period_start, period_end = get_current_period(
+        benefit.frequency, benefit.reset_type, card.open_date, today
+    )
     # Only reset tracking if frequency or reset_type actually changed
     if benefit.frequency != old_frequency or benefit.reset_type != old_reset_type:
-        period_start, _ = get_current_period(
-            benefit.frequency, benefit.reset_type, card.open_date, today
-        )
         benefit.period_start = period_start
         benefit.amount_used = 0
 
     db.commit()
     db.refresh(benefit)
-    return _benefit_to_out(benefit, card.open_date, today)
+    return _benefit_to_out(benefit, period_start, period_end, today)
 
 
 def delete_benefit(db: Session, benefit: CardBenefit) -> None:
@@ -163,23 +248,22 @@ def update_usage(
     db: Session, benefit: CardBenefit, card: Card, data: BenefitUsageUpdate, user_id: int | None = None
 ) -> CardBenefitOut:
     today = get_today(db, user_id)
-    _refresh_period(benefit, card.open_date, today)
+    period = _refresh_period(benefit, card.open_date, today)
     benefit.amount_used = data.amount_used
     db.commit()
     db.refresh(benefit)
-    return _benefit_to_out(benefit, card.open_date, today)
+    return _benefit_to_out(benefit, *period, today)
 
 
 def populate_from_template(
     db: Session, card: Card, credits: list[dict], user_id: int | None = None
 ) -> list[CardBenefitOut]:
     """Bulk create benefits from template credit list, skipping duplicates by name."""
-    existing_names = {
-        b.benefit_name
-        for b in db.query(CardBenefit).filter(CardBenefit.card_id == card.id).all()
-    }
+    existing_names = set(db.scalars(
+        select(CardBenefit.benefit_name).where(CardBenefit.card_id == card.id)
+    ))
     today = get_today(db, user_id)
-    results = []
+    rows = []
     for credit in credits:
         if credit["name"] in existing_names:
             continue
@@ -189,59 +273,84 @@ def populate_from_template(
             card.open_date,
             today,
         )
-        benefit = CardBenefit(
-            card_id=card.id,
-            benefit_name=credit["name"],
-            benefit_amount=credit["amount"],
-            frequency=credit["frequency"],
-            reset_type=credit.get("reset_type", "calendar"),
-            benefit_type=credit.get("benefit_type", "credit"),
-            from_template=True,
-            amount_used=0,
-            notes=credit.get("notes"),
-            period_start=period_start,
+        rows.append({
+            "card_id": card.id,
+            "benefit_name": credit["name"],
+            "benefit_amount": credit["amount"],
+            "frequency": credit["frequency"],
+            "reset_type": credit.get("reset_type", "calendar"),
+            "benefit_type": credit.get("benefit_type", "credit"),
+            "from_template": True,
+            "amount_used": 0,
+            "notes": credit.get("notes"),
+            "period_start": period_start,
+        })
+    if not rows:
+        return []
+    # One INSERT ... RETURNING for the whole batch: the rows come back from the
+    # database with ids and defaults filled in, so there is no per-row refresh.
+    # They are rendered before the commit, which would expire them again.
+    # RETURNING order is not guaranteed to follow the parameters (asking for it
+    # makes SQLAlchemy fall back to one INSERT per row), so nothing is zipped
+    # against `rows`: the order is restored by id and each period recomputed
+    # from its row, a cache hit in get_current_period.
+    inserted = sorted(
+        db.scalars(insert(CardBenefit).returning(CardBenefit), rows).all(),
+        key=lambda b: b.id,
+    )
+    outs = [
+        _benefit_to_out(
+            b, *get_current_period(b.frequency, b.reset_type, card.open_date, today), today
         )
-        db.add(benefit)
-        results.append(benefit)
+        for b in inserted
+    ]
     db.commit()
-    for b in results:
-        db.refresh(b)
-    return [_benefit_to_out(b, card.open_date, today) for b in results]
+    return outs
 
 
 def list_all_benefits(
     db: Session, profile_id: int | None = None, user_id: int | None = None
 ) -> list[BenefitSummaryItem]:
     """Return all non-retired benefits from active cards, with card/profile context."""
-    query = (
-        db.query(CardBenefit, Card, Profile)
+    # Plain columns, not (CardBenefit, Card, Profile) entities: the summary
+    # reads a handful of attributes per row, and for a full dashboard building
+    # and identity-mapping three ORM objects per benefit dominated the request.
+    stmt = (
+        select(
+            CardBenefit.id,
+            CardBenefit.card_id,
+            CardBenefit.benefit_name,
+            CardBenefit.benefit_amount,
+            CardBenefit.frequency,
+            CardBenefit.reset_type,
+            CardBenefit.benefit_type,
+            CardBenefit.from_template,
+            CardBenefit.retired,
+            CardBenefit.notes,
+            CardBenefit.amount_used,
+            CardBenefit.period_start,
+            CardBenefit.created_at,
+            Card.card_name,
+            Card.issuer,
+            Card.last_digits,
+            Card.template_id,
+            Card.card_image,
+            Card.open_date,
+            Profile.id.label("profile_id"),
+            Profile.name.label("profile_name"),
+        )
         .join(Card, CardBenefit.card_id == Card.id)
         .join(Profile, Card.profile_id == Profile.id)
-        .filter(Card.status == "active")
-        .filter(Card.deleted_at == None)  # noqa: E711
-        .filter(CardBenefit.retired == False)  # noqa: E712
+        .where(Card.status == "active")
+        .where(Card.deleted_at == None)  # noqa: E711
+        .where(CardBenefit.retired == False)  # noqa: E712
     )
     if user_id is not None:
-        query = query.filter(Profile.user_id == user_id)
+        stmt = stmt.where(Profile.user_id == user_id)
     if profile_id is not None:
-        query = query.filter(Card.profile_id == profile_id)
+        stmt = stmt.where(Card.profile_id == profile_id)
 
-    rows = query.all()
+    rows = db.execute(stmt).all()
     today = get_today(db, user_id)
 
-    results = []
-    for benefit, card, profile in rows:
-        _refresh_period(benefit, card.open_date, today)
-        out = _benefit_to_out(benefit, card.open_date, today)
-        results.append(BenefitSummaryItem(
-            **out.model_dump(),
-            card_name=card.card_name,
-            issuer=card.issuer,
-            last_digits=card.last_digits,
-            template_id=card.template_id,
-            card_image=card.card_image,
-            profile_id=profile.id,
-            profile_name=profile.name,
-        ))
-    db.commit()
-    return results
+    return _refreshed_outs(db, rows, (row.open_date for row in rows), today, render=_summary_item)
@@ -1,7 +1,10 @@
 import re
+from bisect import bisect_right
 from datetime import date, timedelta
+from itertools import repeat
 
 from dateutil.relativedelta import relativedelta
+from sqlalchemy import delete, exists, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.models.card import Card
@@ -16,6 +19,23 @@ from app.utils.timezone import get_today
 
 MAX_AF_BACKFILL_YEARS = 20
 
+# Template version ids embed their effective year, e.g. "synchrony_ebay_2024_1".
+_VERSION_YEAR_RE = re.compile(r"_(\d{4})_")
+
+
+def _add_years(d: date, n: int) -> date:
+    """`d` moved by whole years, Feb 29 landing on Feb 28 in common years.
+
+    Same result as `d + relativedelta(years=n)` without relativedelta's
+    general-purpose normalisation, which the fee loops would pay once per
+    anniversary. Like `_af_anniversary`, callers step from a fixed origin
+    so the Feb 28 clamp never carries into a later leap year.
+    """
+    try:
+        return d.replace(year=d.year + n)
+    except ValueError:
+        return d.replace(year=d.year + n, day=28)
+
 
 def _af_anniversary(origin: date, n: int) -> date:
     """The nth annual-fee anniversary of `origin` (n >= 1).
@@ -53,13 +73,13 @@ def _next_af_anniversary(origin: date | None, current: date) -> date:
     """First step from origin is +13 months; all subsequent are +12 months."""
     if origin is None:
         # No open date to anchor to; fall back to a plain yearly step.
-        return current + relativedelta(years=1)
+        return _add_years(current, 1)
     return _af_anniversary(origin, _af_anniversary_index(origin, current) + 1)
 
 
 def _cap_anniversary_start(origin: date, anniversary: date, today: date) -> date:
     """Advance anniversary forward so the backfill loop covers at most MAX_AF_BACKFILL_YEARS."""
-    earliest = today - relativedelta(years=MAX_AF_BACKFILL_YEARS)
+    earliest = _add_years(today, -MAX_AF_BACKFILL_YEARS)
     while True:
         next_ann = _next_af_anniversary(origin, anniversary)
         if next_ann > earliest:
@@ -68,38 +88,81 @@ def _cap_anniversary_start(origin: date, anniversary: date, today: date) -> date
     return anniversary
 
 
-def _build_fee_timeline(template_id: str, current_fee: int) -> dict[int, int]:
-    """Build a year→annual_fee mapping from template version history.
+# (years, fees): the versions' years in ascending order and the fee for each,
+# so a lookup is a bisect rather than a scan of every year.
+FeeTimeline = tuple[tuple[int, ...], tuple[int, ...]]
+
+# template_id -> (the versions tuple it was built from, timeline). The loader
+# swaps in new tuples on every reload, so an identity check on the tuple is
+# enough to notice a stale entry without a hook into load_templates.
+_fee_timelines: dict[str, tuple[tuple, FeeTimeline | None]] = {}
+
+
+def _build_fee_timeline(template_id: str) -> FeeTimeline | None:
+    """Build the annual fee history from template version history.
 
     For each version_id matching pattern `_YYYY_`, extract the year and fee.
-    Returns a dict like {2024: 695, 2025: 895}.
-    Falls back to {current year: current_fee} if no versions found.
+    Returns a FeeTimeline like ((2024, 2025), (695, 895)), or None if no
+    versions carry a year (callers then fall back to the card's own fee).
+
+    Only the template's versions go into the result, so it is memoized per
+    template until the next reload.
     """
     versions = get_template_versions(template_id)
-    timeline: dict[int, int] = {}
+    cached = _fee_timelines.get(template_id)
+    if cached is not None and cached[0] is versions:
+        return cached[1]
+    by_year: dict[int, int] = {}
     for v in versions:
         if v.annual_fee is None:
             continue
-        match = re.search(r"_(\d{4})_", v.version_id)
+        match = _VERSION_YEAR_RE.search(v.version_id)
         if match:
             year = int(match.group(1))
-            timeline[year] = v.annual_fee
+            by_year[year] = v.annual_fee
+    timeline = None
+    if by_year:
+        years = tuple(sorted(by_year))
+        timeline = (years, tuple(by_year[y] for y in years))
+    _fee_timelines[template_id] = (versions, timeline)
     return timeline
 
 
-def _get_fee_for_year(timeline: dict[int, int], year: int) -> int | None:
+def _get_fee_for_year(timeline: FeeTimeline, year: int) -> int:
     """Look up the fee for a given anniversary year from the timeline.
 
     Finds the latest version year <= the anniversary year.
     If none found, uses the oldest version's fee.
     """
-    if not timeline:
-        return None
-    applicable = [y for y in timeline if y <= year]
-    if applicable:
-        return timeline[max(applicable)]
-    # Pre-history: use oldest known version's fee
-    return timeline[min(timeline)]
+    years, fees = timeline
+    # Pre-history (index -1) uses the oldest known version's fee.
+    return fees[max(bisect_right(years, year) - 1, 0)]
+
+
+def _insert_approximate_af_events(db: Session, card: Card, anniversaries: list[date]) -> None:
+    """Write backfilled annual_fee_posted events, one per date in `anniversaries`.
+
+    Each fee comes from the card template's fee history when it has one, the
+    card's own fee otherwise. Backfills can span MAX_AF_BACKFILL_YEARS dates,
+    so they go out as a single insert(CardEvent) rather than an ORM object per
+    year; nothing reads the new events back before the commit.
+    """
+    if not anniversaries:
+        return
+    fee_timeline = _build_fee_timeline(card.template_id) if card.template_id else None
+    if fee_timeline:
+        fees = [_get_fee_for_year(fee_timeline, anniversary.year) for anniversary in anniversaries]
+    else:
+        fees = repeat(card.annual_fee)
+    db.execute(insert(CardEvent), [
+        {
+            "card_id": card.id,
+            "event_type": "annual_fee_posted",
+            "event_date": anniversary,
+            "metadata_json": {"annual_fee": fee, "approximate_date": True},
+        }
+        for anniversary, fee in zip(anniversaries, fees)
+    ])
 
 
 def _populate_benefits_from_template(
@@ -136,60 +199,64 @@ def _populate_benefits_from_template(
             spend_thresholds = tmpl.benefits.spend_thresholds
             bonus_categories = tmpl.benefits.bonus_categories
 
-    if credits:
-        for credit in credits:
-            period_start, _ = get_current_period(
-                credit.frequency,
-                credit.reset_type,
-                open_date,
-                today,
-            )
-            benefit = CardBenefit(
-                card_id=card_id,
-                benefit_name=credit.name,
-                benefit_amount=credit.amount,
-                frequency=credit.frequency,
-                reset_type=credit.reset_type,
-                template_key=credit.key,
-                from_template=True,
-                amount_used=0,
-                period_start=period_start,
-            )
-            db.add(benefit)
-
-    if spend_thresholds:
-        for threshold in spend_thresholds:
-            period_start, _ = get_current_period(
-                threshold.frequency,
-                threshold.reset_type,
-                open_date,
-                today,
-            )
-            benefit = CardBenefit(
-                card_id=card_id,
-                benefit_name=threshold.name,
-                benefit_amount=threshold.spend_required,
-                frequency=threshold.frequency,
-                reset_type=threshold.reset_type,
-                benefit_type="spend_threshold",
-                template_key=threshold.key,
-                from_template=True,
-                amount_used=0,
-                notes=threshold.description,
-                period_start=period_start,
-            )
-            db.add(benefit)
+    # Collected and written with one insert per table rather than an ORM object
+    # per row: nothing reads the new rows back before the caller commits.
+    benefit_rows = []
+    for credit in credits or ():
+        period_start, _ = get_current_period(
+            credit.frequency,
+            credit.reset_type,
+            open_date,
+            today,
+        )
+        benefit_rows.append({
+            "card_id": card_id,
+            "benefit_name": credit.name,
+            "benefit_amount": credit.amount,
+            "frequency": credit.frequency,
+            "reset_type": credit.reset_type,
+            "benefit_type": "credit",
+            "template_key": credit.key,
+            "from_template": True,
+            "amount_used": 0,
+            "notes": None,
+            "period_start": period_start,
+        })
+    for threshold in spend_thresholds or ():
+        period_start, _ = get_current_period(
+            threshold.frequency,
+            threshold.reset_type,
+            open_date,
+            today,
+        )
+        benefit_rows.append({
+            "card_id": card_id,
+            "benefit_name": threshold.name,
+            "benefit_amount": threshold.spend_required,
+            "frequency": threshold.frequency,
+            "reset_type": threshold.reset_type,
+            "benefit_type": "spend_threshold",
+            "template_key": threshold.key,
+            "from_template": True,
+            "amount_used": 0,
+            "notes": threshold.description,
+            "period_start": period_start,
+        })
+    if benefit_rows:
+        db.execute(insert(CardBenefit), benefit_rows)
 
     if bonus_categories:
-        for bc in bonus_categories:
-            db.add(CardBonusCategory(
-                card_id=card_id,
-                category=bc.category,
-                multiplier=bc.multiplier,
-                portal_only=bc.portal_only,
-                cap=bc.cap,
-                from_template=True,
-            ))
+        db.execute(insert(CardBonusCategory), [
+            {
+                "card_id": card_id,
+                "category": bc.category,
+                "multiplier": bc.multiplier,
+                "portal_only": bc.portal_only,
+                "cap": bc.cap,
+                "from_template": True,
+            }
+            for bc in bonus_categories
+        ])
 
 
 def _backfill_af_events(
@@ -197,13 +264,15 @@ def _backfill_af_events(
     card: Card,
     today: date,
     stop_date: date | None = None,
+    skip_existing: bool = False,
 ) -> date | None:
     """Create approximate annual_fee_posted events up to `today`.
 
     Returns the next anniversary after the backfilled range, or None if the card
     has no open date or no fee. `stop_date` bounds the loop for a card that is
     already closed — without it, creating a card with status="closed" produced
-    fee events for every year after the closure.
+    fee events for every year after the closure. `skip_existing` leaves out
+    dates that already have a fee event, for a card with history (reopen).
     """
     if not card.open_date or not card.annual_fee or card.annual_fee <= 0:
         return None
@@ -212,26 +281,23 @@ def _backfill_af_events(
     if stop_date is not None and stop_date < limit:
         limit = stop_date
 
-    fee_timeline: dict[int, int] = {}
-    if card.template_id:
-        fee_timeline = _build_fee_timeline(card.template_id, card.annual_fee)
+    existing_dates: set[date] = set()
+    if skip_existing:
+        # One query for every fee date already on record, not one per anniversary.
+        existing_dates = set(db.scalars(
+            select(CardEvent.event_date).where(
+                CardEvent.card_id == card.id,
+                CardEvent.event_type == "annual_fee_posted",
+            )
+        ))
 
+    missing = []
     anniversary = _cap_anniversary_start(card.open_date, card.open_date, today)
     while anniversary <= limit:
-        fee = (
-            _get_fee_for_year(fee_timeline, anniversary.year)
-            if fee_timeline
-            else card.annual_fee
-        )
-        if fee is None:
-            fee = card.annual_fee
-        db.add(CardEvent(
-            card_id=card.id,
-            event_type="annual_fee_posted",
-            event_date=anniversary,
-            metadata_json={"annual_fee": fee, "approximate_date": True},
-        ))
+        if anniversary not in existing_dates:
+            missing.append(anniversary)
         anniversary = _next_af_anniversary(card.open_date, anniversary)
+    _insert_approximate_af_events(db, card, missing)
 
     # Keep stepping past today so the returned date is genuinely upcoming.
     while anniversary <= today:
@@ -244,17 +310,15 @@ def create_card(db: Session, data: CardCreate, user_id: int | None = None) -> Ca
     template_version_id = None
     use_old_version = False
     if data.template_id:
+        tmpl = get_template(data.template_id)
         if data.template_version_id:
             # User selected a specific (possibly old) version
             template_version_id = data.template_version_id
             # Check if it differs from current
-            tmpl = get_template(data.template_id)
             if tmpl and tmpl.version_id != data.template_version_id:
                 use_old_version = True
-        else:
-            tmpl = get_template(data.template_id)
-            if tmpl:
-                template_version_id = tmpl.version_id
+        elif tmpl:
+            template_version_id = tmpl.version_id
 
     card = Card(
         profile_id=data.profile_id,
@@ -302,6 +366,8 @@ def create_card(db: Session, data: CardCreate, user_id: int | None = None) -> Ca
         )
         db.add(event)
 
+    today = get_today(db, user_id)
+
     # Auto-populate benefits from template
     if data.template_id:
         _populate_benefits_from_template(
@@ -310,11 +376,10 @@ def create_card(db: Session, data: CardCreate, user_id: int | None = None) -> Ca
             data.template_id,
             data.open_date,
             version_id=data.template_version_id if use_old_version else None,
-            today=get_today(db, user_id),
+            today=today,
         )
 
     # Auto-generate past annual fee events (including first year at open_date)
-    today = get_today(db, user_id)
     next_anniversary = _backfill_af_events(db, card, today, stop_date=card.close_date)
     if next_anniversary and not data.annual_fee_date:
         card.annual_fee_date = next_anniversary
@@ -384,15 +449,11 @@ def update_card(db: Session, card: Card, data: CardUpdate, user_id: int | None =
     gained_open_date = "open_date" in update_data and old_open_date is None
     gained_fee = "annual_fee" in update_data and old_annual_fee in (None, 0)
     if (gained_open_date or gained_fee) and card.status == "active":
-        existing_af = (
-            db.query(CardEvent)
-            .filter(
-                CardEvent.card_id == card.id,
-                CardEvent.event_type == "annual_fee_posted",
-            )
-            .first()
-        )
-        if not existing_af:
+        has_af_history = db.scalar(select(exists().where(
+            CardEvent.card_id == card.id,
+            CardEvent.event_type == "annual_fee_posted",
+        )))
+        if not has_af_history:
             today = get_today(db, user_id)
             next_anniversary = _backfill_af_events(db, card, today)
             if next_anniversary and not card.annual_fee_date:
@@ -458,42 +519,11 @@ def reopen_card(db: Session, card: Card, user_id: int | None = None) -> Card:
     )
     db.add(event)
 
-    # Restore annual fee tracking if card has an annual fee
-    if card.open_date and card.annual_fee and card.annual_fee > 0:
-        fee_timeline: dict[int, int] = {}
-        if card.template_id:
-            fee_timeline = _build_fee_timeline(card.template_id, card.annual_fee)
-
-        # Find the next upcoming anniversary from open_date, capped to avoid excessive backfill
-        anniversary = _cap_anniversary_start(card.open_date, card.open_date, today)
-        while anniversary <= today:
-            # Generate AF events for any missed anniversaries that don't already exist
-            existing = (
-                db.query(CardEvent)
-                .filter(
-                    CardEvent.card_id == card.id,
-                    CardEvent.event_type == "annual_fee_posted",
-                    CardEvent.event_date == anniversary,
-                )
-                .first()
-            )
-            if not existing:
-                fee = (
-                    _get_fee_for_year(fee_timeline, anniversary.year)
-                    if fee_timeline
-                    else card.annual_fee
-                )
-                if fee is None:
-                    fee = card.annual_fee
-                af_event = CardEvent(
-                    card_id=card.id,
-                    event_type="annual_fee_posted",
-                    event_date=anniversary,
-                    metadata_json={"annual_fee": fee, "approximate_date": True},
-                )
-                db.add(af_event)
-            anniversary = _next_af_anniversary(card.open_date, anniversary)
-        card.annual_fee_date = anniversary
+    # Restore annual fee tracking if card has an annual fee, filling in any
+    # anniversaries missed while it was closed.
+    next_anniversary = _backfill_af_events(db, card, today, skip_existing=True)
+    if next_anniversary:
+        card.annual_fee_date = next_anniversary
 
     db.commit()
     db.refresh(card)
@@ -530,6 +560,8 @@ def product_change(
         raise ValueError("change_date cannot be before open_date")
     old_template_id = card.template_id
     old_card_name = card.card_name
+    # Resolved once for the benefit sync and the fee regeneration below.
+    today = get_today(db, user_id)
 
     card.template_id = new_template_id
     # The pin referred to a version of the PREVIOUS template. Carrying it over
@@ -569,7 +601,7 @@ def product_change(
 
     # Sync benefits from new template if requested
     if sync_benefits:
-        _sync_benefits_for_product_change(db, card, user_id)
+        _sync_benefits_for_product_change(db, card, today)
 
     if reset_af_anniversary:
         # Create AF event at the product change date for the new card's fee
@@ -584,7 +616,7 @@ def product_change(
             db.add(af_event)
 
         # Recalculate AF events from change_date forward
-        _recalculate_af_events_after_change(db, card, change_date, user_id)
+        _recalculate_af_events_after_change(db, card, change_date, today)
 
     # Create upgrade bonus if provided
     if upgrade_bonus_amount:
@@ -607,21 +639,19 @@ def product_change(
     return card
 
 
-def _sync_benefits_for_product_change(
-    db: Session, card: Card, user_id: int | None = None
-) -> None:
+def _sync_benefits_for_product_change(db: Session, card: Card, today: date) -> None:
     """Retire old template benefits, replace bonus categories, and populate new ones."""
-    # Retire all from_template benefits
-    old_benefits = (
-        db.query(CardBenefit)
-        .filter(
+    # Retire all from_template benefits, in one UPDATE. The session isn't
+    # synchronized: nothing before the commit reads these rows again.
+    db.execute(
+        update(CardBenefit)
+        .where(
             CardBenefit.card_id == card.id,
-            CardBenefit.from_template == True,
+            CardBenefit.from_template == True,  # noqa: E712
         )
-        .all()
+        .values(retired=True)
+        .execution_options(synchronize_session=False)
     )
-    for b in old_benefits:
-        b.retired = True
 
     # Delete old from_template bonus categories
     db.query(CardBonusCategory).filter(
@@ -632,28 +662,28 @@ def _sync_benefits_for_product_change(
     # Populate new template benefits + bonus categories
     if card.template_id:
         _populate_benefits_from_template(
-            db, card.id, card.template_id, card.open_date, today=get_today(db, user_id)
+            db, card.id, card.template_id, card.open_date, today=today
         )
 
 
 def _recalculate_af_events_after_change(
-    db: Session, card: Card, change_date: date, user_id: int | None = None
+    db: Session, card: Card, change_date: date, today: date
 ) -> None:
     """Delete future approximate AF events after change_date and regenerate
     using the new template's fee timeline."""
-    # Always clean up approximate AF events after change_date (even for $X→$0)
-    future_af_events = (
-        db.query(CardEvent)
-        .filter(
+    # Always clean up approximate AF events after change_date (even for $X→$0).
+    # One DELETE filtered on the JSON flag, rather than loading each event to
+    # inspect it; nothing below reads these rows, so the session needn't sync.
+    db.execute(
+        delete(CardEvent)
+        .where(
             CardEvent.card_id == card.id,
             CardEvent.event_type == "annual_fee_posted",
             CardEvent.event_date > change_date,
+            CardEvent.metadata_json["approximate_date"].as_boolean() == True,  # noqa: E712
         )
-        .all()
+        .execution_options(synchronize_session=False)
     )
-    for evt in future_af_events:
-        if evt.metadata_json and evt.metadata_json.get("approximate_date"):
-            db.delete(evt)
 
     if not card.annual_fee or card.annual_fee <= 0:
         # Transitioning to $0 AF — clear the next AF date
@@ -663,28 +693,14 @@ def _recalculate_af_events_after_change(
     # Regenerate from change_date forward using new template's fee timeline.
     # After a PC, the AF anniversary resets to the change_date (since the full
     # new AF is charged at the PC date, the next AF is change_date + 1 year).
-    today = get_today(db, user_id)
-    fee_timeline: dict[int, int] = {}
-    if card.template_id:
-        fee_timeline = _build_fee_timeline(card.template_id, card.annual_fee)
-
-    anniversary = change_date + relativedelta(years=1)
+    anniversaries = []
+    years = 1
+    anniversary = _add_years(change_date, years)
     while anniversary <= today:
-        fee = (
-            _get_fee_for_year(fee_timeline, anniversary.year)
-            if fee_timeline
-            else card.annual_fee
-        )
-        if fee is None:
-            fee = card.annual_fee
-        af_event = CardEvent(
-            card_id=card.id,
-            event_type="annual_fee_posted",
-            event_date=anniversary,
-            metadata_json={"annual_fee": fee, "approximate_date": True},
-        )
-        db.add(af_event)
-        anniversary = anniversary + relativedelta(years=1)
+        anniversaries.append(anniversary)
+        years += 1
+        anniversary = _add_years(change_date, years)
+    _insert_approximate_af_events(db, card, anniversaries)
 
     # Next AF = first anniversary of the PC date that's in the future
     card.annual_fee_date = anniversary
@@ -15,6 +15,7 @@ import hashlib
 import logging
 import os
 import pathlib
+from functools import lru_cache
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -87,28 +88,42 @@ def root_key_material() -> bytes:
 
 def _derive_from_secret_key() -> bytes:
     """Legacy derivation: PBKDF2 over SECRET_KEY. Still read for migration."""
+    return _pbkdf2_key(settings.secret_key)
+
+
+# Keyed on the secret itself, so a SECRET_KEY change is picked up on the next
+# call with no invalidation hook, while every call in between skips the 100k
+# rounds. That matters most for a ciphertext no key opens: decrypt_value falls
+# through to this derivation on every attempt.
+@lru_cache(maxsize=1)
+def _pbkdf2_key(secret_key: str) -> bytes:
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
         salt=b"cct-fernet-v1",
         iterations=100_000,
     )
-    return base64.urlsafe_b64encode(kdf.derive(settings.secret_key.encode()))
+    return base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
+
+
+@lru_cache(maxsize=4)
+def _fernet(key: bytes) -> Fernet:
+    return Fernet(key)
 
 
 def _get_fernet_new() -> Fernet:
-    return Fernet(_load_or_create_key())
+    return _fernet(_load_or_create_key())
 
 
 def _get_fernet_pbkdf2() -> Fernet:
     """Previous key derivation (PBKDF2 over SECRET_KEY), for migration."""
-    return Fernet(_derive_from_secret_key())
+    return _fernet(_derive_from_secret_key())
 
 
 def _get_fernet_old() -> Fernet:
     """Oldest key derivation (single SHA-256, no salt), for migration."""
     key = hashlib.sha256(settings.secret_key.encode()).digest()
-    return Fernet(base64.urlsafe_b64encode(key))
+    return _fernet(base64.urlsafe_b64encode(key))
 
 
 def encrypt_value(plaintext: str) -> str:
@@ -121,16 +136,17 @@ def decrypt_value(ciphertext: str) -> str:
     Raises DecryptionError (not InvalidToken) when nothing works, so callers can
     surface an actionable "re-enter this secret" message instead of a 500.
     """
-    # Built lazily: the two fallbacks each run PBKDF2 at 100k iterations, and
-    # this is on the OAuth token-exchange path. The current key almost always
-    # wins on the first attempt.
+    # Built lazily: the PBKDF2 fallback costs 100k iterations the first time
+    # for a given SECRET_KEY, and this is on the OAuth token-exchange path.
+    # The current key almost always wins on the first attempt.
+    token = ciphertext.encode()
     for build, label in (
         (_get_fernet_new, "current"),
         (_get_fernet_pbkdf2, "SECRET_KEY-derived (PBKDF2)"),
         (_get_fernet_old, "SECRET_KEY-derived (legacy SHA-256)"),
     ):
         try:
-            plaintext = build().decrypt(ciphertext.encode()).decode()
+            plaintext = build().decrypt(token).decode()
         except InvalidToken:
             continue
         if label != "current":
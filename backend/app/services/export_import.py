@@ -1,5 +1,8 @@
 from datetime import datetime, timezone
 
+import orjson
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, selectinload
 
 from app.models.card import Card
@@ -11,128 +14,146 @@ from app.models.card_event import CardEvent
 from app.models.profile import Profile
 from app.models.setting import Setting
 from app.models.user_setting import UserSetting
-from app.utils.timezone import resolve_timezone
-from app.schemas.export_import import (
-    ExportBenefit,
-    ExportBonus,
-    ExportBonusCategory,
-    ExportCard,
-    ExportData,
-    ExportEvent,
-    ExportProfile,
-    ImportResult,
-)
-
-
-def export_profiles(db: Session, profile_id: int | None = None, user_id: int | None = None) -> ExportData:
-    query = db.query(Profile).options(
-        selectinload(Profile.cards).selectinload(Card.events),
-        selectinload(Profile.cards).selectinload(Card.benefits),
-        selectinload(Profile.cards).selectinload(Card.bonuses),
-        selectinload(Profile.cards).selectinload(Card.bonus_categories),
+from app.utils.timezone import forget_timezones, resolve_timezone
+from app.schemas.export_import import ExportCard, ExportData, ImportResult
+
+# Settings keys an import may write. Anything else in the file is ignored.
+_IMPORTABLE_SETTINGS = frozenset({"timezone"})
+
+# Profiles loaded per round of export queries; each batch brings its cards and
+# their children along via selectinload.
+_EXPORT_BATCH_SIZE = 20
+
+
+def _export_profile(profile: Profile) -> dict:
+    # Plain dicts with the same keys, in the same order, as the Export* schemas.
+    # They go straight to orjson; building the Pydantic models just to dump
+    # them again was most of the export's CPU time.
+    export_cards = []
+    for card in profile.cards:
+        export_events = [
+            {
+                "original_id": e.id,
+                "event_type": e.event_type,
+                "event_date": e.event_date,
+                "description": e.description,
+                "metadata_json": e.metadata_json,
+            }
+            for e in card.events
+        ]
+        export_benefits = [
+            {
+                "benefit_name": b.benefit_name,
+                "benefit_amount": b.benefit_amount,
+                "frequency": b.frequency,
+                "reset_type": b.reset_type,
+                "from_template": b.from_template,
+                "template_key": b.template_key,
+                "user_modified": b.user_modified,
+                "retired": b.retired,
+                "notes": b.notes,
+                "amount_used": b.amount_used,
+                "benefit_type": b.benefit_type,
+                "period_start": b.period_start,
+            }
+            for b in card.benefits
+        ]
+        export_bonuses = [
+            {
+                "bonus_source": b.bonus_source,
+                "event_id": b.event_id,
+                "bonus_amount": b.bonus_amount,
+                "bonus_credit_amount": b.bonus_credit_amount,
+                "bonus_type": b.bonus_type,
+                "bonus_earned": b.bonus_earned,
+                "bonus_missed": b.bonus_missed,
+                "spend_requirement": b.spend_requirement,
+                "spend_deadline": b.spend_deadline,
+                "spend_reminder_enabled": b.spend_reminder_enabled,
+                "spend_reminder_notes": b.spend_reminder_notes,
+                "description": b.description,
+            }
+            for b in card.bonuses
+        ]
+        export_bonus_categories = [
+            {
+                "category": bc.category,
+                "multiplier": bc.multiplier,
+                "portal_only": bc.portal_only,
+                "cap": bc.cap,
+                "from_template": bc.from_template,
+            }
+            for bc in card.bonus_categories
+        ]
+        export_cards.append(
+            {
+                "template_id": card.template_id,
+                "template_version_id": card.template_version_id,
+                "template_version_pinned": card.template_version_pinned,
+                "card_image": card.card_image,
+                "card_name": card.card_name,
+                "last_digits": card.last_digits,
+                "issuer": card.issuer,
+                "network": card.network,
+                "card_type": card.card_type,
+                "status": card.status,
+                "open_date": card.open_date,
+                "close_date": card.close_date,
+                "annual_fee": card.annual_fee,
+                "annual_fee_date": card.annual_fee_date,
+                "annual_fee_user_modified": card.annual_fee_user_modified,
+                "credit_limit": card.credit_limit,
+                "custom_notes": card.custom_notes,
+                "custom_tags": card.custom_tags,
+                "spend_reminder_enabled": card.spend_reminder_enabled,
+                "spend_requirement": card.spend_requirement,
+                "spend_deadline": card.spend_deadline,
+                "spend_reminder_notes": card.spend_reminder_notes,
+                "signup_bonus_amount": card.signup_bonus_amount,
+                "signup_bonus_type": card.signup_bonus_type,
+                "signup_bonus_earned": card.signup_bonus_earned,
+                "events": export_events,
+                "benefits": export_benefits,
+                "bonuses": export_bonuses,
+                "bonus_categories": export_bonus_categories,
+            }
+        )
+    return {"name": profile.name, "cards": export_cards}
+
+
+def export_profiles_json(db: Session, profile_id: int | None = None, user_id: int | None = None) -> bytes:
+    """The export document (an ExportData) serialized to JSON.
+
+    Profiles are read in batches and each is serialized as soon as it is
+    built, so a large account never holds its whole tree as ORM objects and
+    as a dict copy at once; only the finished bytes accumulate. The document
+    has the same shape and field order as ExportData.
+    """
+    # Soft-deleted cards are filtered in the loader, so neither they nor their
+    # children are fetched at all.
+    stmt = select(Profile).options(
+        selectinload(Profile.cards.and_(Card.deleted_at == None)).options(  # noqa: E711
+            selectinload(Card.events),
+            selectinload(Card.benefits),
+            selectinload(Card.bonuses),
+            selectinload(Card.bonus_categories),
+        )
     )
     if user_id is not None:
-        query = query.filter(Profile.user_id == user_id)
+        stmt = stmt.where(Profile.user_id == user_id)
     if profile_id is not None:
-        query = query.filter(Profile.id == profile_id)
-    profiles = query.all()
-
-    export_profiles_list = []
-    for profile in profiles:
-        export_cards = []
-        for card in profile.cards:
-            if card.deleted_at is not None:
-                continue
-            export_events = [
-                ExportEvent(
-                    original_id=e.id,
-                    event_type=e.event_type,
-                    event_date=e.event_date,
-                    description=e.description,
-                    metadata_json=e.metadata_json,
-                )
-                for e in card.events
-            ]
-            export_benefits = [
-                ExportBenefit(
-                    benefit_name=b.benefit_name,
-                    benefit_amount=b.benefit_amount,
-                    frequency=b.frequency,
-                    reset_type=b.reset_type,
-                    from_template=b.from_template,
-                    template_key=b.template_key,
-                    user_modified=b.user_modified,
-                    retired=b.retired,
-                    notes=b.notes,
-                    amount_used=b.amount_used,
-                    benefit_type=b.benefit_type,
-                    period_start=b.period_start,
-                )
-                for b in card.benefits
-            ]
-            export_bonuses = [
-                ExportBonus(
-                    bonus_source=b.bonus_source,
-                    event_id=b.event_id,
-                    bonus_amount=b.bonus_amount,
-                    bonus_credit_amount=b.bonus_credit_amount,
-                    bonus_type=b.bonus_type,
-                    bonus_earned=b.bonus_earned,
-                    bonus_missed=b.bonus_missed,
-                    spend_requirement=b.spend_requirement,
-                    spend_deadline=b.spend_deadline,
-                    spend_reminder_enabled=b.spend_reminder_enabled,
-                    spend_reminder_notes=b.spend_reminder_notes,
-                    description=b.description,
-                )
-                for b in card.bonuses
-            ]
-            export_bonus_categories = [
-                ExportBonusCategory(
-                    category=bc.category,
-                    multiplier=bc.multiplier,
-                    portal_only=bc.portal_only,
-                    cap=bc.cap,
-                    from_template=bc.from_template,
-                )
-                for bc in card.bonus_categories
-            ]
-            export_cards.append(
-                ExportCard(
-                    template_id=card.template_id,
-                    template_version_id=card.template_version_id,
-                    template_version_pinned=card.template_version_pinned,
-                    card_image=card.card_image,
-                    card_name=card.card_name,
-                    last_digits=card.last_digits,
-                    issuer=card.issuer,
-                    network=card.network,
-                    card_type=card.card_type,
-                    status=card.status,
-                    open_date=card.open_date,
-                    close_date=card.close_date,
-                    annual_fee=card.annual_fee,
-                    annual_fee_date=card.annual_fee_date,
-                    annual_fee_user_modified=card.annual_fee_user_modified,
-                    credit_limit=card.credit_limit,
-                    custom_notes=card.custom_notes,
-                    custom_tags=card.custom_tags,
-                    spend_reminder_enabled=card.spend_reminder_enabled,
-                    spend_requirement=card.spend_requirement,
-                    spend_deadline=card.spend_deadline,
-                    spend_reminder_notes=card.spend_reminder_notes,
-                    signup_bonus_amount=card.signup_bonus_amount,
-                    signup_bonus_type=card.signup_bonus_type,
-                    signup_bonus_earned=card.signup_bonus_earned,
-                    events=export_events,
-                    benefits=export_benefits,
-                    bonuses=export_bonuses,
-                    bonus_categories=export_bonus_categories,
-                )
-            )
-        export_profiles_list.append(
-            ExportProfile(name=profile.name, cards=export_cards)
-        )
+        stmt = stmt.where(Profile.id == profile_id)
+
+    body = bytearray(b'{"version":1,"exported_at":')
+    # OPT_UTC_Z keeps the "Z" suffix the Pydantic-serialized export always had.
+    body += orjson.dumps(datetime.now(timezone.utc), option=orjson.OPT_UTC_Z)
+    body += b',"profiles":['
+    profiles = db.scalars(stmt.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+    for i, profile in enumerate(profiles):
+        if i:
+            body += b","
+        body += orjson.dumps(_export_profile(profile))
+    body += b'],"settings":'
 
     # Export settings (prefer per-user settings)
     if user_id is not None:
@@ -140,124 +161,140 @@ def export_profiles(db: Session, profile_id: int | None = None, user_id: int | N
     else:
         all_settings = db.query(Setting).all()
     settings_dict = {s.key: s.value for s in all_settings} if all_settings else None
-
-    return ExportData(
-        version=1,
-        exported_at=datetime.now(timezone.utc),
-        profiles=export_profiles_list,
-        settings=settings_dict,
-    )
+    body += orjson.dumps(settings_dict)
+    body += b"}"
+    return bytes(body)
 
 
 def _create_cards_and_events(
     db: Session, profile: Profile, cards_data: list[ExportCard]
 ) -> tuple[int, int, int, int, int]:
-    cards_count = 0
-    events_count = 0
-    benefits_count = 0
-    bonuses_count = 0
-    bonus_categories_count = 0
-    for card_data in cards_data:
-        card = Card(
-            profile_id=profile.id,
-            template_id=card_data.template_id,
-            template_version_id=card_data.template_version_id,
-            template_version_pinned=card_data.template_version_pinned,
-            card_image=card_data.card_image,
-            card_name=card_data.card_name,
-            last_digits=card_data.last_digits,
-            issuer=card_data.issuer,
-            network=card_data.network,
-            card_type=card_data.card_type,
-            status=card_data.status,
-            open_date=card_data.open_date,
-            close_date=card_data.close_date,
-            annual_fee=card_data.annual_fee,
-            annual_fee_date=card_data.annual_fee_date,
-            annual_fee_user_modified=card_data.annual_fee_user_modified,
-            credit_limit=card_data.credit_limit,
-            custom_notes=card_data.custom_notes,
-            custom_tags=card_data.custom_tags,
-            spend_reminder_enabled=card_data.spend_reminder_enabled,
-            spend_requirement=card_data.spend_requirement,
-            spend_deadline=card_data.spend_deadline,
-            spend_reminder_notes=card_data.spend_reminder_notes,
-            signup_bonus_amount=card_data.signup_bonus_amount,
-            signup_bonus_type=card_data.signup_bonus_type,
-            signup_bonus_earned=card_data.signup_bonus_earned,
-        )
-        db.add(card)
-        db.flush()
-        cards_count += 1
-
-        event_id_map: dict[int, int] = {}
+    # Every table is written with one insert of plain dicts: an import can
+    # carry thousands of rows, and going through db.add meant an ORM object,
+    # a unit-of-work pass and (for cards and events) a flush apiece.
+    if not cards_data:
+        return 0, 0, 0, 0, 0
+
+    # RETURNING order isn't guaranteed to follow the parameters, but SQLite
+    # assigns rowids in insertion order, so the new ids sorted line up with the
+    # rows that produced them (as in populate_from_template).
+    card_ids = sorted(db.scalars(insert(Card).returning(Card.id), [
+        {
+            "profile_id": profile.id,
+            "template_id": card_data.template_id,
+            "template_version_id": card_data.template_version_id,
+            "template_version_pinned": card_data.template_version_pinned,
+            "card_image": card_data.card_image,
+            "card_name": card_data.card_name,
+            "last_digits": card_data.last_digits,
+            "issuer": card_data.issuer,
+            "network": card_data.network,
+            "card_type": card_data.card_type,
+            "status": card_data.status,
+            "open_date": card_data.open_date,
+            "close_date": card_data.close_date,
+            "annual_fee": card_data.annual_fee,
+            "annual_fee_date": card_data.annual_fee_date,
+            "annual_fee_user_modified": card_data.annual_fee_user_modified,
+            "credit_limit": card_data.credit_limit,
+            "custom_notes": card_data.custom_notes,
+            "custom_tags": card_data.custom_tags,
+            "spend_reminder_enabled": card_data.spend_reminder_enabled,
+            "spend_requirement": card_data.spend_requirement,
+            "spend_deadline": card_data.spend_deadline,
+            "spend_reminder_notes": card_data.spend_reminder_notes,
+            "signup_bonus_amount": card_data.signup_bonus_amount,
+            "signup_bonus_type": card_data.signup_bonus_type,
+            "signup_bonus_earned": card_data.signup_bonus_earned,
+        }
+        for card_data in cards_data
+    ]))
+    imported = list(zip(card_ids, cards_data))
+
+    # Bonuses point at events by their id in the exported database, so the new
+    # event ids are needed before the bonus rows can be built.
+    event_rows: list[dict] = []
+    event_keys: list[tuple[int, int | None]] = []
+    for card_id, card_data in imported:
         for event_data in card_data.events:
-            event = CardEvent(
-                card_id=card.id,
-                event_type=event_data.event_type,
-                event_date=event_data.event_date,
-                description=event_data.description,
-                metadata_json=event_data.metadata_json,
-            )
-            db.add(event)
-            if event_data.original_id is not None:
-                db.flush()
-                event_id_map[event_data.original_id] = event.id
-            events_count += 1
-
-        for benefit_data in card_data.benefits:
-            benefit = CardBenefit(
-                card_id=card.id,
-                benefit_name=benefit_data.benefit_name,
-                benefit_amount=benefit_data.benefit_amount,
-                frequency=benefit_data.frequency,
-                reset_type=benefit_data.reset_type,
-                from_template=benefit_data.from_template,
-                template_key=benefit_data.template_key,
-                user_modified=benefit_data.user_modified,
-                retired=benefit_data.retired,
-                notes=benefit_data.notes,
-                amount_used=benefit_data.amount_used,
-                benefit_type=benefit_data.benefit_type,
-                period_start=benefit_data.period_start,
-            )
-            db.add(benefit)
-            benefits_count += 1
-
-        for bonus_data in card_data.bonuses:
-            new_event_id = None
-            if bonus_data.event_id is not None:
-                new_event_id = event_id_map.get(bonus_data.event_id)
-            bonus = CardBonus(
-                card_id=card.id,
-                event_id=new_event_id,
-                bonus_source=bonus_data.bonus_source,
-                bonus_amount=bonus_data.bonus_amount,
-                bonus_credit_amount=bonus_data.bonus_credit_amount,
-                bonus_type=bonus_data.bonus_type,
-                bonus_earned=bonus_data.bonus_earned,
-                bonus_missed=bonus_data.bonus_missed,
-                spend_requirement=bonus_data.spend_requirement,
-                spend_deadline=bonus_data.spend_deadline,
-                spend_reminder_enabled=bonus_data.spend_reminder_enabled,
-                spend_reminder_notes=bonus_data.spend_reminder_notes,
-                description=bonus_data.description,
-            )
-            db.add(bonus)
-            bonuses_count += 1
+            event_rows.append({
+                "card_id": card_id,
+                "event_type": event_data.event_type,
+                "event_date": event_data.event_date,
+                "description": event_data.description,
+                "metadata_json": event_data.metadata_json,
+            })
+            event_keys.append((card_id, event_data.original_id))
+    event_id_map: dict[tuple[int, int], int] = {}
+    if event_rows:
+        new_ids = sorted(db.scalars(insert(CardEvent).returning(CardEvent.id), event_rows))
+        event_id_map = {
+            key: new_id for key, new_id in zip(event_keys, new_ids) if key[1] is not None
+        }
 
-        for bc_data in card_data.bonus_categories:
-            db.add(CardBonusCategory(
-                card_id=card.id,
-                category=bc_data.category,
-                multiplier=bc_data.multiplier,
-                portal_only=bc_data.portal_only,
-                cap=bc_data.cap,
-                from_template=bc_data.from_template,
-            ))
-            bonus_categories_count += 1
+    benefit_rows = [
+        {
+            "card_id": card_id,
+            "benefit_name": benefit_data.benefit_name,
+            "benefit_amount": benefit_data.benefit_amount,
+            "frequency": benefit_data.frequency,
+            "reset_type": benefit_data.reset_type,
+            "from_template": benefit_data.from_template,
+            "template_key": benefit_data.template_key,
+            "user_modified": benefit_data.user_modified,
+            "retired": benefit_data.retired,
+            "notes": benefit_data.notes,
+            "amount_used": benefit_data.amount_used,
+            "benefit_type": benefit_data.benefit_type,
+            "period_start": benefit_data.period_start,
+        }
+        for card_id, card_data in imported
+        for benefit_data in card_data.benefits
+    ]
+    bonus_rows = [
+        {
+            "card_id": card_id,
+            "event_id": (
+                event_id_map.get((card_id, bonus_data.event_id))
+                if bonus_data.event_id is not None
+                else None
+            ),
+            "bonus_source": bonus_data.bonus_source,
+            "bonus_amount": bonus_data.bonus_amount,
+            "bonus_credit_amount": bonus_data.bonus_credit_amount,
+            "bonus_type": bonus_data.bonus_type,
+            "bonus_earned": bonus_data.bonus_earned,
+            "bonus_missed": bonus_data.bonus_missed,
+            "spend_requirement": bonus_data.spend_requirement,
+            "spend_deadline": bonus_data.spend_deadline,
+            "spend_reminder_enabled": bonus_data.spend_reminder_enabled,
+            "spend_reminder_notes": bonus_data.spend_reminder_notes,
+            "description": bonus_data.description,
+        }
+        for card_id, card_data in imported
+        for bonus_data in card_data.bonuses
+    ]
+    bonus_category_rows = [
+        {
+            "card_id": card_id,
+            "category": bc_data.category,
+            "multiplier": bc_data.multiplier,
+            "portal_only": bc_data.portal_only,
+            "cap": bc_data.cap,
+            "from_template": bc_data.from_template,
+        }
+        for card_id, card_data in imported
+        for bc_data in card_data.bonus_categories
+    ]
+    for model, rows in (
+        (CardBenefit, benefit_rows),
+        (CardBonus, bonus_rows),
+        (CardBonusCategory, bonus_category_rows),
+    ):
+        if rows:
+            db.execute(insert(model), rows)
 
-    return cards_count, events_count, benefits_count, bonuses_count, bonus_categories_count
+    return len(card_ids), len(event_rows), len(benefit_rows), len(bonus_rows), len(bonus_category_rows)
 
 
 def _secret_identity(card_name: str, issuer: str, open_date) -> tuple:
@@ -369,6 +406,22 @@ def _restore_card_secrets(db: Session, profile: Profile, carried: dict[tuple, di
     return restored
 
 
+def _delete_live_cards(db: Session, profile: Profile) -> None:
+    """Delete a profile's non-deleted cards in one statement.
+
+    The foreign keys' ON DELETE CASCADE removes events, benefits, bonuses,
+    bonus categories and stored details, so none of them is loaded just to be
+    deleted. Instances already in the session are left to expire: the restore
+    step and the import's commit both reload from the table.
+    """
+    db.execute(
+        delete(Card)
+        .where(Card.profile_id == profile.id, Card.deleted_at == None)  # noqa: E711
+        .execution_options(synchronize_session=False)
+    )
+    db.expire(profile, ["cards"])
+
+
 def import_profiles(
     db: Session,
     data: ExportData,
@@ -385,12 +438,14 @@ def import_profiles(
         existing_names = {p.name.lower() for p in name_query.all()}
         for profile_data in data.profiles:
             name = profile_data.name
-            if name.lower() in existing_names:
+            lname = name.lower()
+            if lname in existing_names:
                 suffix = 2
-                while f"{name} ({suffix})".lower() in existing_names:
+                while f"{lname} ({suffix})" in existing_names:
                     suffix += 1
                 name = f"{name} ({suffix})"
-            existing_names.add(name.lower())
+                lname = f"{lname} ({suffix})"
+            existing_names.add(lname)
 
             profile = Profile(name=name, user_id=user_id)
             db.add(profile)
@@ -421,17 +476,13 @@ def import_profiles(
         # every stored card number with no warning and no way back.
         carried = _capture_card_secrets(db, profile)
 
-        # Delete existing cards (cascade deletes events and benefits).
-        # Soft-deleted cards are excluded: export_profiles skips them, so they
+        # Delete existing cards (the database cascades to their children).
+        # Soft-deleted cards are excluded: export_profiles_json skips them, so they
         # were never in the file the user is restoring, and they are still
         # recoverable via POST /api/cards/{id}/restore. Destroying them here
         # made "export then re-import" silently lossy. Merge mode already
         # treats them this way.
-        for card in list(profile.cards):
-            if card.deleted_at is not None:
-                continue
-            db.delete(card)
-        db.flush()
+        _delete_live_cards(db, profile)
 
         profile_data = data.profiles[0]
         cards, events, benefits, bonuses, bcats = _create_cards_and_events(db, profile, profile_data.cards)
@@ -454,22 +505,24 @@ def import_profiles(
             raise ValueError("Target profile not found")
 
         # Build set of existing (non-deleted) cards for duplicate detection (case-insensitive)
-        existing_cards = db.query(Card).filter(
-            Card.profile_id == profile.id, Card.deleted_at == None  # noqa: E711
-        ).all()
+        # Only the key columns; lowercased in Python because SQLite's lower()
+        # folds ASCII only and would miss e.g. "CAFÉ" vs "café".
+        existing_rows = db.execute(
+            select(Card.card_name, Card.issuer, Card.open_date).where(
+                Card.profile_id == profile.id, Card.deleted_at == None  # noqa: E711
+            )
+        )
         existing_keys = {
-            (c.card_name.lower(), c.issuer.lower(), c.open_date) for c in existing_cards
+            (name.lower(), issuer.lower(), open_date) for name, issuer, open_date in existing_rows
         }
 
         # Filter out duplicates (case-insensitive matching)
         profile_data = data.profiles[0]
-        new_cards = []
-        for card_data in profile_data.cards:
-            key = (card_data.card_name.lower(), card_data.issuer.lower(), card_data.open_date)
-            if key in existing_keys:
-                result.cards_skipped += 1
-            else:
-                new_cards.append(card_data)
+        new_cards = [
+            cd for cd in profile_data.cards
+            if (cd.card_name.lower(), cd.issuer.lower(), cd.open_date) not in existing_keys
+        ]
+        result.cards_skipped = len(profile_data.cards) - len(new_cards)
 
         cards, events, benefits, bonuses, bcats = _create_cards_and_events(db, profile, new_cards)
         result.profiles_imported = 1
@@ -486,34 +539,27 @@ def import_profiles(
     # An unvalidated timezone here used to poison every date-aware endpoint with
     # a permanent 500 -- the import path applied none of the validation that
     # PUT /api/settings does.
-    _IMPORTABLE_SETTINGS = {"timezone"}
-    if data.settings:
-        data.settings = {
-            k: v for k, v in data.settings.items()
-            if k != "timezone" or resolve_timezone(v) is not None
-        }
+    settings_to_import = {
+        k: v for k, v in (data.settings or {}).items()
+        if k in _IMPORTABLE_SETTINGS and (k != "timezone" or resolve_timezone(v) is not None)
+    }
+    if settings_to_import:
+        # One upsert for all keys instead of a SELECT and a write per key.
         if user_id is not None:
-            for key, value in data.settings.items():
-                if key not in _IMPORTABLE_SETTINGS:
-                    continue
-                existing = (
-                    db.query(UserSetting)
-                    .filter(UserSetting.user_id == user_id, UserSetting.key == key)
-                    .first()
-                )
-                if existing:
-                    existing.value = value
-                else:
-                    db.add(UserSetting(user_id=user_id, key=key, value=value))
+            stmt = sqlite_insert(UserSetting).values(
+                [{"user_id": user_id, "key": k, "value": v} for k, v in settings_to_import.items()]
+            )
+            index_elements = [UserSetting.user_id, UserSetting.key]
         else:
-            for key, value in data.settings.items():
-                if key not in _IMPORTABLE_SETTINGS:
-                    continue
-                existing_setting = db.get(Setting, key)
-                if existing_setting:
-                    existing_setting.value = value
-                else:
-                    db.add(Setting(key=key, value=value))
+            stmt = sqlite_insert(Setting).values(
+                [{"key": k, "value": v} for k, v in settings_to_import.items()]
+            )
+            index_elements = [Setting.key]
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={"value": stmt.excluded.value},
+        ))
+        forget_timezones(db)
 
     db.commit()
     return result
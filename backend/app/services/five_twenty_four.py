@@ -1,17 +1,23 @@
 from dateutil.relativedelta import relativedelta
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.card import Card
 from app.utils.timezone import get_today
 
+# Month arithmetic happens before the extra day, same as adding the two
+# separately; it stays in Python because SQLite's date(..., '+24 months')
+# rolls Feb 29 over into March instead of clamping to Feb 28.
+_DROPOFF_AFTER = relativedelta(months=24, days=1)
+
 
 def get_524_details(db: Session, profile_id: int, user_id: int | None = None) -> dict:
     """Get 5/24 count and per-card drop-off dates for a profile."""
     cutoff = get_today(db, user_id) - relativedelta(months=24)
-    cards = (
-        db.query(Card)
-        .filter(
+    rows = db.execute(
+        select(Card.id, Card.card_name, Card.last_digits, Card.open_date)
+        .where(
             Card.profile_id == profile_id,
             Card.card_type == "personal",
             Card.open_date != None,  # noqa: E711
@@ -19,23 +25,22 @@ def get_524_details(db: Session, profile_id: int, user_id: int | None = None) ->
             Card.deleted_at == None,  # noqa: E711
         )
         .order_by(Card.open_date)
-        .all()
-    )
+    ).all()
 
-    dropoff_dates = []
-    for card in cards:
-        # The count filter is open_date >= today-24mo, so a card opened exactly
-        # 24 months ago still counts today; it first drops off the next day.
-        dropoff = card.open_date + relativedelta(months=24) + relativedelta(days=1)
-        dropoff_dates.append({
-            "card_id": card.id,
-            "card_name": card.card_name,
-            "last_digits": card.last_digits,
-            "open_date": card.open_date.isoformat(),
-            "dropoff_date": dropoff.isoformat(),
-        })
+    # The count filter is open_date >= today-24mo, so a card opened exactly
+    # 24 months ago still counts today; it first drops off the next day.
+    dropoff_dates = [
+        {
+            "card_id": card_id,
+            "card_name": card_name,
+            "last_digits": last_digits,
+            "open_date": open_date.isoformat(),
+            "dropoff_date": (open_date + _DROPOFF_AFTER).isoformat(),
+        }
+        for card_id, card_name, last_digits, open_date in rows
+    ]
 
-    count = len(cards)
+    count = len(rows)
     return {
         "count": count,
         "status": "green" if count < 4 else ("yellow" if count == 4 else "red"),
@@ -2,21 +2,19 @@
 
 import secrets
 from datetime import datetime, timezone
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 import httpx
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
 
 from app.models.oauth_account import OAuthAccount
 from app.models.oauth_provider import OAuthProvider as OAuthProviderModel
 from app.models.profile import Profile
-from app.models.setting import Setting
 from app.models.user import User
-from app.models.user_setting import UserSetting
 from app.services.crypto import decrypt_value, encrypt_value
-from app.services.setup_service import get_system_config
+from app.services.setup_service import copy_global_settings, get_system_config
 
 
 class AccountDeactivatedError(Exception):
@@ -37,15 +35,19 @@ def generate_state() -> str:
 
 
 def get_authorization_url(provider: OAuthProviderModel, redirect_uri: str, state: str) -> str:
-    """Build the OAuth authorization URL."""
-    params = {
-        "client_id": provider.client_id,
-        "redirect_uri": redirect_uri,
-        "state": state,
-        "response_type": "code",
-        "scope": provider.scopes or "",
-    }
-    query = urlencode({k: v for k, v in params.items() if v})
+    """Build the OAuth authorization URL.
+
+    Assembled directly instead of through urlencode(): the keys are fixed,
+    `state` comes from generate_state() and is already URL-safe, and only the
+    provider-configured values need quoting. Empty values are left out.
+    """
+    query = f"state={state}&response_type=code"
+    if redirect_uri:
+        query = f"redirect_uri={quote_plus(redirect_uri)}&{query}"
+    if provider.client_id:
+        query = f"client_id={quote_plus(provider.client_id)}&{query}"
+    if provider.scopes:
+        query += f"&scope={quote_plus(provider.scopes)}"
     return f"{provider.authorization_url}?{query}"
 
 
@@ -57,8 +59,11 @@ async def exchange_code(
     """Exchange authorization code for tokens and user info."""
     client_secret = decrypt_value(provider.client_secret_encrypted)
 
-    # Exchange code for tokens
+    # One client for every request of the exchange, so a provider serving more
+    # than one of them from the same host (GitHub's userinfo and emails) reuses
+    # the connection instead of paying a second TCP + TLS handshake.
     async with httpx.AsyncClient() as client:
+        # Exchange code for tokens
         token_resp = await client.post(
             provider.token_url,
             data={
@@ -73,16 +78,15 @@ async def exchange_code(
         token_resp.raise_for_status()
         token_data = token_resp.json()
 
-    access_token = token_data.get("access_token")
-    if not access_token:
-        raise ValueError("No access_token in response")
+        access_token = token_data.get("access_token")
+        if not access_token:
+            raise ValueError("No access_token in response")
 
-    # Fetch user info
-    userinfo_url = provider.userinfo_url
-    if not userinfo_url:
-        raise ValueError("Provider has no userinfo_url configured")
+        # Fetch user info
+        userinfo_url = provider.userinfo_url
+        if not userinfo_url:
+            raise ValueError("Provider has no userinfo_url configured")
 
-    async with httpx.AsyncClient() as client:
         userinfo_resp = await client.get(
             userinfo_url,
             headers={"Authorization": f"Bearer {access_token}", "Accept": "application/json"},
@@ -90,22 +94,21 @@ async def exchange_code(
         userinfo_resp.raise_for_status()
         userinfo = userinfo_resp.json()
 
-    # GitHub's userinfo `email` is the public profile email and may be unverified
-    # or null. Resolve the verified primary email so extract_user_info can trust it.
-    if provider.provider_name == "github":
-        try:
-            async with httpx.AsyncClient() as client:
+        # GitHub's userinfo `email` is the public profile email and may be unverified
+        # or null. Resolve the verified primary email so extract_user_info can trust it.
+        if provider.provider_name == "github":
+            try:
                 emails_resp = await client.get(
                     "https://api.github.com/user/emails",
                     headers={"Authorization": f"Bearer {access_token}", "Accept": "application/json"},
                 )
-            if emails_resp.status_code == 200:
-                for entry in emails_resp.json():
-                    if entry.get("primary") and entry.get("verified") and entry.get("email"):
-                        userinfo["_verified_email"] = entry["email"]
-                        break
-        except httpx.HTTPError:
-            pass  # No verified email resolved → email stays unset (safe default)
+                if emails_resp.status_code == 200:
+                    for entry in emails_resp.json():
+                        if entry.get("primary") and entry.get("verified") and entry.get("email"):
+                            userinfo["_verified_email"] = entry["email"]
+                            break
+            except httpx.HTTPError:
+                pass  # No verified email resolved → email stays unset (safe default)
 
     return {
         "access_token": access_token,
@@ -142,45 +145,62 @@ def extract_user_info(provider_name: str, userinfo: dict) -> dict:
     return info
 
 
+def _extract_github(userinfo: dict) -> dict:
+    # GitHub's profile `email` is the public email and may be unverified or
+    # null; exchange_code() resolves the verified primary into _verified_email.
+    return {
+        "provider_user_id": str(userinfo.get("id", "")),
+        "email": userinfo.get("_verified_email"),
+        "name": userinfo.get("name") or userinfo.get("login", ""),
+        "username": userinfo.get("login", ""),
+    }
+
+
+def _extract_discord(userinfo: dict) -> dict:
+    return {
+        "provider_user_id": userinfo.get("id", ""),
+        "email": userinfo.get("email") if _is_verified(userinfo.get("verified")) else None,
+        "name": userinfo.get("global_name") or userinfo.get("username", ""),
+        "username": userinfo.get("username", ""),
+    }
+
+
+def _extract_facebook(userinfo: dict) -> dict:
+    # Facebook's Graph API returns `id`, never OIDC's `sub`, and asserts no
+    # email_verified claim — so email can never drive linking here.
+    return {
+        "provider_user_id": str(userinfo.get("id", "")),
+        "email": None,
+        "name": userinfo.get("name", ""),
+        "username": userinfo.get("name", ""),
+    }
+
+
+def _extract_oidc(userinfo: dict) -> dict:
+    # Standard OIDC (Google, Apple, generic). Fall back to `id` for
+    # non-OIDC providers an admin may have registered by hand; an empty
+    # subject is rejected by extract_user_info rather than being treated as
+    # an identity.
+    raw_email = userinfo.get("email")
+    email = raw_email if (raw_email and _is_verified(userinfo.get("email_verified"))) else None
+    return {
+        "provider_user_id": str(userinfo.get("sub") or userinfo.get("id") or ""),
+        "email": email,
+        "name": userinfo.get("name", ""),
+        "username": raw_email.split("@", 1)[0] if raw_email else "",
+    }
+
+
+# Providers whose userinfo isn't standard OIDC; everything else uses _extract_oidc.
+_EXTRACTORS = {
+    "github": _extract_github,
+    "discord": _extract_discord,
+    "facebook": _extract_facebook,
+}
+
+
 def _extract_user_info(provider_name: str, userinfo: dict) -> dict:
-    if provider_name == "github":
-        # GitHub's profile `email` is the public email and may be unverified or
-        # null; exchange_code() resolves the verified primary into _verified_email.
-        return {
-            "provider_user_id": str(userinfo.get("id", "")),
-            "email": userinfo.get("_verified_email"),
-            "name": userinfo.get("name") or userinfo.get("login", ""),
-            "username": userinfo.get("login", ""),
-        }
-    elif provider_name == "discord":
-        raw_email = userinfo.get("email")
-        return {
-            "provider_user_id": userinfo.get("id", ""),
-            "email": raw_email if _is_verified(userinfo.get("verified")) else None,
-            "name": userinfo.get("global_name") or userinfo.get("username", ""),
-            "username": userinfo.get("username", ""),
-        }
-    elif provider_name == "facebook":
-        # Facebook's Graph API returns `id`, never OIDC's `sub`, and asserts no
-        # email_verified claim — so email can never drive linking here.
-        return {
-            "provider_user_id": str(userinfo.get("id", "")),
-            "email": None,
-            "name": userinfo.get("name", ""),
-            "username": userinfo.get("name", ""),
-        }
-    else:
-        # Standard OIDC (Google, Apple, generic). Fall back to `id` for
-        # non-OIDC providers an admin may have registered by hand; an empty
-        # subject is rejected below rather than being treated as an identity.
-        raw_email = userinfo.get("email")
-        email = raw_email if (raw_email and _is_verified(userinfo.get("email_verified"))) else None
-        return {
-            "provider_user_id": str(userinfo.get("sub") or userinfo.get("id") or ""),
-            "email": email,
-            "name": userinfo.get("name", ""),
-            "username": raw_email.split("@")[0] if raw_email else "",
-        }
+    return _EXTRACTORS.get(provider_name, _extract_oidc)(userinfo)
 
 
 def _link_oauth_account(
@@ -225,17 +245,17 @@ def find_or_create_user(
             "Check the provider's userinfo URL and scopes."
         )
 
-    # Check for existing OAuth link
-    existing_account = (
-        db.query(OAuthAccount)
-        .filter(
+    # Check for existing OAuth link, fetching its user in the same query
+    row = db.execute(
+        select(OAuthAccount, User)
+        .outerjoin(User, User.id == OAuthAccount.user_id)
+        .where(
             OAuthAccount.provider == provider_name,
             OAuthAccount.provider_user_id == provider_user_id,
         )
-        .first()
-    )
-    if existing_account:
-        user = db.get(User, existing_account.user_id)
+    ).first()
+    if row:
+        existing_account, user = row
         if not user or not user.is_active:
             raise AccountDeactivatedError("Your account has been deactivated")
         # Update tokens
@@ -250,7 +270,7 @@ def find_or_create_user(
     # the very first login on "registration_enabled" left the instance with zero
     # users, no way to create one, and setup_complete already set -- recoverable
     # only by hand-editing cards.db.
-    is_first_user = db.query(User).first() is None
+    is_first_user = not db.scalar(select(exists().select_from(User)))
 
     if not is_first_user:
         reg_enabled = get_system_config(db, "registration_enabled", "true") == "true"
@@ -278,10 +298,18 @@ def find_or_create_user(
             return existing_email_user
 
     username = user_info.get("username") or f"{provider_name}_{provider_user_id}"
-    # Ensure unique username
+    # Ensure unique username: every candidate starts with the base, so one
+    # query fetches all the names a suffix could collide with.
     base_username = username
+    taken = set(
+        db.scalars(
+            select(func.lower(User.username)).where(
+                func.lower(User.username).startswith(base_username.lower(), autoescape=True)
+            )
+        )
+    )
     suffix = 1
-    while db.query(User).filter(func.lower(User.username) == username.lower()).first():
+    while username.lower() in taken:
         username = f"{base_username}_{suffix}"
         suffix += 1
 
@@ -303,8 +331,7 @@ def find_or_create_user(
     # First user: adopt orphan profiles and migrate global settings
     if is_first_user:
         db.query(Profile).filter(Profile.user_id.is_(None)).update({"user_id": user.id})
-        for s in db.query(Setting).all():
-            db.add(UserSetting(user_id=user.id, key=s.key, value=s.value))
+        copy_global_settings(db, user.id)
 
     _link_oauth_account(db, user, provider_name, provider_user_id, email, oauth_tokens)
     user.last_login = datetime.now(timezone.utc)
@@ -1,3 +1,4 @@
+from sqlalchemy import exists, insert, literal, select
 from sqlalchemy.orm import Session
 
 from app.models.oauth_provider import OAuthProvider
@@ -18,7 +19,7 @@ def is_setup_complete(db: Session) -> bool:
 
 
 def has_existing_data(db: Session) -> bool:
-    return db.query(Profile).first() is not None
+    return db.scalar(select(exists().select_from(Profile)))
 
 
 def get_system_config(db: Session, key: str, default: str = "") -> str:
@@ -34,6 +35,16 @@ def set_system_config(db: Session, key: str, value: str) -> None:
         db.add(SystemConfig(key=key, value=value))
 
 
+def copy_global_settings(db: Session, user_id: int) -> None:
+    """Copy every global setting to `user_id` in one INSERT ... SELECT."""
+    db.execute(
+        insert(UserSetting).from_select(
+            ["user_id", "key", "value"],
+            select(literal(user_id), Setting.key, Setting.value),
+        )
+    )
+
+
 def complete_setup(db: Session, data: SetupCompleteRequest) -> tuple[User | None, str]:
     """Run initial setup. Returns (user, access_token). For multi_user_oauth, returns (None, "")."""
     if is_setup_complete(db):
@@ -94,9 +105,7 @@ def complete_setup(db: Session, data: SetupCompleteRequest) -> tuple[User | None
     db.query(Profile).filter(Profile.user_id.is_(None)).update({"user_id": user.id})
 
     # Migrate existing global settings → user_settings
-    global_settings = db.query(Setting).all()
-    for s in global_settings:
-        db.add(UserSetting(user_id=user.id, key=s.key, value=s.value))
+    copy_global_settings(db, user.id)
 
     # For single_password mode, store the password hash in system_config
     if data.auth_mode == "single_password" and password_hash:
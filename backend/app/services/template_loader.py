@@ -5,6 +5,7 @@ import re
 from pathlib import Path
 
 import yaml
+from pydantic import TypeAdapter
 
 from app.config import settings
 from app.schemas.template import CardTemplateOut, TemplateVersionDetail, TemplateVersionSummary
@@ -12,73 +13,158 @@ from app.schemas.template import CardTemplateOut, TemplateVersionDetail, Templat
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader parses an order of magnitude faster than the pure-Python
+# one; PyYAML wheels ship it, but a source build without libyaml may not.
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
 _templates: dict[str, CardTemplateOut] = {}
 _image_paths: dict[str, Path] = {}
 _image_file_paths: dict[str, dict[str, Path]] = {}
 _old_versions: dict[str, dict[str, TemplateVersionDetail]] = {}
 _old_image_paths: dict[str, dict[str, Path]] = {}
 _load_errors: list[str] = []
+# Resolved templates root the image paths above were found under; the
+# containment check in get_template_image_path_by_filename compares against it
+# instead of resolving the configured directory on every image request.
+_templates_root: Path | None = None
+
+# Read-only views derived from the maps above. Built once per load and swapped
+# in with them, so the list/version endpoints hand back the same tuples on every
+# request instead of rebuilding lists (and re-scanning for an issuer) each call.
+_all_templates: tuple[CardTemplateOut, ...] = ()
+_templates_by_issuer: dict[str, tuple[CardTemplateOut, ...]] = {}
+_version_summaries: dict[str, tuple[TemplateVersionSummary, ...]] = {}
+
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(tuple[CardTemplateOut, ...])
+
+
+def _serialize_templates(templates: tuple[CardTemplateOut, ...]) -> tuple[bytes, str]:
+    """JSON body and a strong ETag for a template list response."""
+    body = _TEMPLATE_LIST_ADAPTER.dump_json(templates)
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+# The same views pre-serialized to JSON, with an ETag each. The catalog only
+# changes on a reload, so GET /api/templates would otherwise run the whole
+# model -> dict -> json pipeline over every template on every request to
+# produce identical bytes.
+_EMPTY_TEMPLATES_JSON = _serialize_templates(())
+_all_templates_json: tuple[bytes, str] = _EMPTY_TEMPLATES_JSON
+_templates_by_issuer_json: dict[str, tuple[bytes, str]] = {}
 
 _last_fingerprint: str = ""
 
+# Parsed YAML by path, reused while the file's (mtime_ns, size) is unchanged, so
+# a hot reload triggered by one edited template re-parses only that file. Each
+# load builds a fresh map from the files it actually read, which drops entries
+# for files that have since been removed.
+_yaml_cache: dict[str, tuple[int, int, object]] = {}
+
 IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+_OLD_VERSION_FILE_RE = re.compile(r"^card_(.+)\.ya?ml$")
 _TRACKED_EXTENSIONS = IMAGE_EXTENSIONS + (".yaml", ".yml")
 
 
-def _find_image(card_dir: Path) -> Path | None:
+def _load_yaml(path: str, cache: dict[str, tuple[int, int, object]]) -> object:
+    """Parse `path`, or return the previous load's result if the file is unchanged.
+
+    The returned object is shared across loads and must not be mutated.
+    """
+    st = os.stat(path)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        data = cached[2]
+    else:
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+    cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _scan_dir(directory: str) -> tuple[list[str], dict[str, str]]:
+    """One readdir of `directory`: (sorted subdirectory names, {filename: path}).
+
+    Both are empty if it doesn't exist or isn't a directory. Replaces the
+    iterdir() + is_dir()/is_file()/exists() round of syscalls per entry the
+    loader used to make. Paths stay plain strings; only the ones the loader
+    keeps (images) are turned into Path objects.
+    """
+    dirs: list[str] = []
+    files: dict[str, str] = {}
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return dirs, files
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                elif entry.is_file():
+                    files[entry.name] = entry.path
+            except OSError:
+                continue
+    dirs.sort()
+    return dirs, files
+
+
+def _find_image(files: dict[str, str]) -> Path | None:
     for ext in IMAGE_EXTENSIONS:
-        img = card_dir / f"card{ext}"
-        if img.exists():
-            return img
+        img = files.get(f"card{ext}")
+        if img is not None:
+            return Path(img)
     return None
 
 
-def _find_all_images(card_dir: Path) -> dict[str, Path]:
+def _find_all_images(files: dict[str, str], old_files: dict[str, str]) -> dict[str, Path]:
     """Find all image files in a template directory and its old/ subdirectory.
 
-    Returns {filename: Path} with card.{ext} first, then alphabetical.
-    Top-level files win on filename conflicts with old/.
+    Takes the file listings from _scan_dir. Returns {filename: Path} with
+    card.{ext} first, then alphabetical. Top-level files win on filename
+    conflicts with old/.
     """
-    images: dict[str, Path] = {}
+    images: dict[str, str] = {}
     default_name: str | None = None
 
-    # Scan card_dir for all image files
-    for f in sorted(card_dir.iterdir()):
-        if not f.is_file() or f.suffix.lower() not in IMAGE_EXTENSIONS:
+    # Gather unsorted; the single sort happens when building the result.
+    for name, path in files.items():
+        stem, suffix = os.path.splitext(name)
+        if suffix.lower() not in IMAGE_EXTENSIONS:
             continue
-        if ":Zone.Identifier" in f.name:
+        if ":Zone.Identifier" in name:
             continue
-        images[f.name] = f
-        if f.stem.lower() == "card":
-            default_name = f.name
-
-    # Scan old/ subdirectory
-    old_dir = card_dir / "old"
-    if old_dir.exists() and old_dir.is_dir():
-        for f in sorted(old_dir.iterdir()):
-            if not f.is_file() or f.suffix.lower() not in IMAGE_EXTENSIONS:
-                continue
-            if ":Zone.Identifier" in f.name:
-                continue
-            if f.name not in images:  # top-level wins on conflict
-                images[f.name] = f
+        images[name] = path
+        # Several card.{ext} files: the alphabetically last one is the default.
+        if stem.lower() == "card" and (default_name is None or name > default_name):
+            default_name = name
 
-    # Ensure card.{ext} is first (it's the default)
-    if default_name:
-        ordered: dict[str, Path] = {default_name: images.pop(default_name)}
-        for k in sorted(images):
-            ordered[k] = images[k]
-        return ordered
+    for name, path in old_files.items():
+        if os.path.splitext(name)[1].lower() not in IMAGE_EXTENSIONS:
+            continue
+        if ":Zone.Identifier" in name:
+            continue
+        images.setdefault(name, path)  # top-level wins on conflict
 
-    return dict(sorted(images.items()))
+    # card.{ext} first (it's the default), then alphabetical
+    ordered: dict[str, Path] = {}
+    if default_name:
+        ordered[default_name] = Path(images[default_name])
+    for name in sorted(images):
+        if name != default_name:
+            ordered[name] = Path(images[name])
+    return ordered
 
 
 def _load_old_versions(
-    card_dir: Path,
+    old_files: dict[str, str],
     template_id: str,
     old_vers: dict[str, dict[str, TemplateVersionDetail]],
     old_imgs: dict[str, dict[str, Path]],
     errors: list[str],
+    yaml_cache: dict[str, tuple[int, int, object]],
 ) -> None:
     """Scan old/ subdirectory for versioned YAML files and their images.
 
@@ -88,31 +174,27 @@ def _load_old_versions(
     call to `get_template_versions` — which `create_card` goes through — turning
     a load-time skip into a 500 on the app's primary write path.
     """
-    old_dir = card_dir / "old"
-    if not old_dir.exists() or not old_dir.is_dir():
+    if not old_files:
         return
 
     versions: dict[str, TemplateVersionDetail] = {}
     image_paths: dict[str, Path] = {}
 
-    for f in sorted(old_dir.iterdir()):
-        if not f.is_file() or f.suffix not in (".yaml", ".yml"):
-            continue
+    for name in sorted(old_files):
         # Expected: card_<version_id>.yaml
-        match = re.match(r"^card_(.+)\.ya?ml$", f.name)
+        match = _OLD_VERSION_FILE_RE.match(name)
         if not match:
             continue
         version_id = match.group(1)
         try:
-            with open(f) as fh:
-                data = yaml.safe_load(fh)
+            data = _load_yaml(old_files[name], yaml_cache)
         except Exception as exc:
-            errors.append(f"{template_id}/old/{f.name}: failed to parse YAML: {exc}")
+            errors.append(f"{template_id}/old/{name}: failed to parse YAML: {exc}")
             logger.warning("Skipping old version %s/%s: %s", template_id, version_id, exc)
             continue
         if not isinstance(data, dict):
             if data is not None:
-                errors.append(f"{template_id}/old/{f.name}: expected a mapping at the top level")
+                errors.append(f"{template_id}/old/{name}: expected a mapping at the top level")
                 logger.warning(
                     "Skipping old version %s/%s: expected a mapping, got %s",
                     template_id, version_id, type(data).__name__,
@@ -122,9 +204,9 @@ def _load_old_versions(
         # Resolve the image first — has_image is part of the validated model.
         image_path: Path | None = None
         for ext in IMAGE_EXTENSIONS:
-            img = old_dir / f"card_{version_id}{ext}"
-            if img.exists():
-                image_path = img
+            img = old_files.get(f"card_{version_id}{ext}")
+            if img is not None:
+                image_path = Path(img)
                 break
 
         try:
@@ -142,7 +224,7 @@ def _load_old_versions(
                 is_current=False,
             )
         except Exception as exc:
-            errors.append(f"{template_id}/old/{f.name}: validation error: {exc}")
+            errors.append(f"{template_id}/old/{name}: validation error: {exc}")
             logger.warning(
                 "Skipping old version %s/%s: validation error: %s", template_id, version_id, exc
             )
@@ -157,6 +239,33 @@ def _load_old_versions(
         old_imgs[template_id] = image_paths
 
 
+def _scan_tracked_files(root: str, entries: list[tuple[str, float, int]]) -> None:
+    """Append (path, mtime, size) for every tracked file under `root`.
+
+    Walks with os.scandir so file-vs-directory comes from the readdir d_type
+    instead of a stat per entry; only tracked files are stat'ed. Hidden
+    directories are skipped and directory symlinks are not followed, as
+    os.walk did.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    if not entry.name.startswith(".") and not entry.is_symlink():
+                        _scan_tracked_files(entry.path, entries)
+                    continue
+                if not entry.name.lower().endswith(_TRACKED_EXTENSIONS):
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry.path, st.st_mtime, st.st_size))
+
+
 def _compute_fingerprint() -> str:
     """Fingerprint the templates directory: a hash over (path, mtime, size).
 
@@ -170,23 +279,48 @@ def _compute_fingerprint() -> str:
         return ""
     digest = hashlib.sha256()
     entries: list[tuple[str, float, int]] = []
-    for root, dirs, files in os.walk(templates_dir):
-        # Skip hidden directories
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
-        for name in files:
-            if not any(name.lower().endswith(ext) for ext in _TRACKED_EXTENSIONS):
-                continue
-            path = os.path.join(root, name)
-            try:
-                st = os.stat(path)
-            except OSError:
-                continue
-            entries.append((path, st.st_mtime, st.st_size))
+    _scan_tracked_files(str(templates_dir), entries)
     for path, mtime, size in sorted(entries):
         digest.update(f"{path}:{mtime}:{size}\n".encode())
     return digest.hexdigest()
 
 
+def _build_version_summaries(
+    templates: dict[str, CardTemplateOut],
+    old_versions: dict[str, dict[str, TemplateVersionDetail]],
+) -> dict[str, tuple[TemplateVersionSummary, ...]]:
+    """Current + old version summaries per template, current first."""
+    summaries: dict[str, tuple[TemplateVersionSummary, ...]] = {}
+    for template_id, current in templates.items():
+        result: list[TemplateVersionSummary] = []
+        if current.version_id:
+            result.append(TemplateVersionSummary(
+                version_id=current.version_id,
+                name=current.name,
+                annual_fee=current.annual_fee,
+                is_current=True,
+            ))
+        for vid, detail in old_versions.get(template_id, {}).items():
+            result.append(TemplateVersionSummary(
+                version_id=vid,
+                name=detail.name,
+                annual_fee=detail.annual_fee,
+                is_current=False,
+            ))
+        summaries[template_id] = tuple(result)
+    return summaries
+
+
+def _index_by_issuer(
+    templates: dict[str, CardTemplateOut],
+) -> dict[str, tuple[CardTemplateOut, ...]]:
+    """Group templates under their lowercased issuer, preserving load order."""
+    grouped: dict[str, list[CardTemplateOut]] = {}
+    for template in templates.values():
+        grouped.setdefault(template.issuer.lower(), []).append(template)
+    return {issuer: tuple(group) for issuer, group in grouped.items()}
+
+
 def load_templates() -> None:
     """Load all YAML card templates from the templates directory.
 
@@ -194,6 +328,8 @@ def load_templates() -> None:
     """
     global _templates, _image_paths, _image_file_paths
     global _old_versions, _old_image_paths, _last_fingerprint, _load_errors
+    global _all_templates, _templates_by_issuer, _version_summaries
+    global _all_templates_json, _templates_by_issuer_json, _yaml_cache, _templates_root
 
     new_templates: dict[str, CardTemplateOut] = {}
     new_image_paths: dict[str, Path] = {}
@@ -201,6 +337,7 @@ def load_templates() -> None:
     new_old_versions: dict[str, dict[str, TemplateVersionDetail]] = {}
     new_old_image_paths: dict[str, dict[str, Path]] = {}
     new_errors: list[str] = []
+    new_yaml_cache: dict[str, tuple[int, int, object]] = {}
 
     templates_dir = Path(settings.card_templates_dir)
     if not templates_dir.exists():
@@ -216,19 +353,22 @@ def load_templates() -> None:
         _last_fingerprint = _compute_fingerprint()
         return
 
-    for issuer_dir in sorted(templates_dir.iterdir()):
-        if not issuer_dir.is_dir() or issuer_dir.name.startswith("."):
+    for issuer_name in _scan_dir(str(templates_dir))[0]:
+        if issuer_name.startswith("."):
             continue
-        for card_dir in sorted(issuer_dir.iterdir()):
-            if not card_dir.is_dir() or card_dir.name.startswith("."):
+        issuer_dir = os.path.join(templates_dir, issuer_name)
+        for card_name in _scan_dir(issuer_dir)[0]:
+            if card_name.startswith("."):
                 continue
-            yaml_file = card_dir / "card.yaml"
-            if not yaml_file.exists():
+            card_dir = os.path.join(issuer_dir, card_name)
+            subdirs, files = _scan_dir(card_dir)
+            yaml_file = files.get("card.yaml")
+            if yaml_file is None:
                 continue
-            template_id = f"{issuer_dir.name}/{card_dir.name}"
+            old_files = _scan_dir(os.path.join(card_dir, "old"))[1] if "old" in subdirs else {}
+            template_id = f"{issuer_name}/{card_name}"
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                data = _load_yaml(yaml_file, new_yaml_cache)
             except Exception as exc:
                 new_errors.append(f"{template_id}: failed to parse YAML: {exc}")
                 logger.warning("Skipping template %s: failed to parse YAML: %s", template_id, exc)
@@ -242,17 +382,11 @@ def load_templates() -> None:
                     )
                 continue
 
-            # Validate required fields exist
-            if not data.get("name"):
-                data["name"] = card_dir.name
-            if not data.get("issuer"):
-                data["issuer"] = issuer_dir.name
-
-            image_path = _find_image(card_dir)
+            image_path = _find_image(files)
             if image_path:
                 new_image_paths[template_id] = image_path
 
-            image_map = _find_all_images(card_dir)
+            image_map = _find_all_images(files, old_files)
             images = list(image_map.keys())
             if image_map:
                 new_image_file_paths[template_id] = image_map
@@ -260,8 +394,8 @@ def load_templates() -> None:
             try:
                 new_templates[template_id] = CardTemplateOut(
                     id=template_id,
-                    name=data.get("name", card_dir.name),
-                    issuer=data.get("issuer", issuer_dir.name),
+                    name=data.get("name") or card_name,
+                    issuer=data.get("issuer") or issuer_name,
                     network=data.get("network"),
                     annual_fee=data.get("annual_fee"),
                     currency=data.get("currency"),
@@ -280,7 +414,8 @@ def load_templates() -> None:
                 continue
 
             _load_old_versions(
-                card_dir, template_id, new_old_versions, new_old_image_paths, new_errors
+                old_files, template_id, new_old_versions, new_old_image_paths, new_errors,
+                new_yaml_cache,
             )
 
     # Atomic swap
@@ -290,6 +425,15 @@ def load_templates() -> None:
     _old_versions = new_old_versions
     _old_image_paths = new_old_image_paths
     _load_errors = new_errors
+    _yaml_cache = new_yaml_cache
+    _templates_root = templates_dir.resolve()
+    _all_templates = tuple(new_templates.values())
+    _templates_by_issuer = _index_by_issuer(new_templates)
+    _version_summaries = _build_version_summaries(new_templates, new_old_versions)
+    _all_templates_json = _serialize_templates(_all_templates)
+    _templates_by_issuer_json = {
+        issuer: _serialize_templates(group) for issuer, group in _templates_by_issuer.items()
+    }
     _last_fingerprint = _compute_fingerprint()
     logger.info(
         "Loaded %d templates (%d with images, %d file(s) skipped due to errors)",
@@ -326,16 +470,23 @@ def reload_if_changed() -> bool:
     return True
 
 
-def get_all_templates() -> list[CardTemplateOut]:
-    return list(_templates.values())
+def get_all_templates() -> tuple[CardTemplateOut, ...]:
+    return _all_templates
+
+
+def get_templates_json(issuer: str | None = None) -> tuple[bytes, str]:
+    """Pre-serialized (body, etag) for the template list, optionally by issuer."""
+    if issuer:
+        return _templates_by_issuer_json.get(issuer.lower(), _EMPTY_TEMPLATES_JSON)
+    return _all_templates_json
 
 
 def get_template(template_id: str) -> CardTemplateOut | None:
     return _templates.get(template_id)
 
 
-def get_templates_by_issuer(issuer: str) -> list[CardTemplateOut]:
-    return [t for t in _templates.values() if t.issuer.lower() == issuer.lower()]
+def get_templates_by_issuer(issuer: str) -> tuple[CardTemplateOut, ...]:
+    return _templates_by_issuer.get(issuer.lower(), ())
 
 
 def get_template_image_path(template_id: str) -> Path | None:
@@ -354,35 +505,17 @@ def get_template_image_path_by_filename(template_id: str, filename: str) -> Path
     path = file_paths.get(filename)
     if not path:
         return None
-    templates_dir = Path(settings.card_templates_dir).resolve()
+    if _templates_root is None:
+        return None
     resolved = path.resolve()
-    if not resolved.is_relative_to(templates_dir):
+    if not resolved.is_relative_to(_templates_root):
         return None
     return resolved if resolved.exists() else None
 
 
-def get_template_versions(template_id: str) -> list[TemplateVersionSummary]:
-    """Get current + old versions for a template."""
-    result: list[TemplateVersionSummary] = []
-    current = _templates.get(template_id)
-    if current and current.version_id:
-        result.append(TemplateVersionSummary(
-            version_id=current.version_id,
-            name=current.name,
-            annual_fee=current.annual_fee,
-            is_current=True,
-        ))
-
-    old = _old_versions.get(template_id, {})
-    for vid, detail in old.items():
-        result.append(TemplateVersionSummary(
-            version_id=vid,
-            name=detail.name,
-            annual_fee=detail.annual_fee,
-            is_current=False,
-        ))
-
-    return result
+def get_template_versions(template_id: str) -> tuple[TemplateVersionSummary, ...]:
+    """Get current + old versions for a template (built at load time)."""
+    return _version_summaries.get(template_id, ())
 
 
 def get_old_version(template_id: str, version_id: str) -> TemplateVersionDetail | None:
@@ -1,5 +1,7 @@
 import logging
+from collections import defaultdict
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.card import Card
@@ -45,6 +47,7 @@ def sync_cards_to_templates(db: Session, user_id: int | None = None) -> dict:
         )
     cards = query.all()
 
+    todo = []
     for card in cards:
         template = get_template(card.template_id)
         if not template:
@@ -57,25 +60,66 @@ def sync_cards_to_templates(db: Session, user_id: int | None = None) -> dict:
             # The user deliberately chose an older version of this template.
             summary["cards_pinned"] += 1
             continue
-
+        if card.template_version_id == template.version_id:
+            summary["cards_skipped"] += 1
+            continue
+        todo.append((card, template))
+
+    # Children of every card that needs work, in one query per table instead
+    # of two or three per card.
+    card_ids = [card.id for card, _ in todo]
+    benefits_by_card: dict[int, list[CardBenefit]] = defaultdict(list)
+    cats_by_card: dict[int, list[CardBonusCategory]] = defaultdict(list)
+    if card_ids:
+        for b in db.scalars(select(CardBenefit).where(CardBenefit.card_id.in_(card_ids))):
+            benefits_by_card[b.card_id].append(b)
+        for c in db.scalars(select(CardBonusCategory).where(CardBonusCategory.card_id.in_(card_ids))):
+            cats_by_card[c.card_id].append(c)
+
+    # Many cards share a template; derive its lookup maps once per version.
+    maps_by_version: dict[tuple[str, str], tuple[dict, dict]] = {}
+
+    for card, template in todo:
+        benefits = benefits_by_card[card.id]
+        cats = cats_by_card[card.id]
+        version = (card.template_id, template.version_id)
+        maps = maps_by_version.get(version)
+        if maps is None:
+            maps = maps_by_version[version] = _template_maps(template)
+        template_keys, template_cats = maps
         if not card.template_version_id:
             # First run / migration: tag existing benefits as template-sourced,
             # then sync so the card actually receives the template's benefits.
             # Only tagging would mark the card as reconciled with a state it was
             # never reconciled to, and it would never receive them until
             # maintainers happened to bump the template's version_id.
-            _initialize_card(db, card, template, summary)
-
-        if card.template_version_id == template.version_id:
-            summary["cards_skipped"] += 1
-        else:
-            _sync_card(db, card, template, summary)
+            _initialize_card(card, summary, benefits, cats, template_keys, template_cats)
+        _sync_card(db, card, template, summary, benefits, cats, template_cats)
 
     db.commit()
     return summary
 
 
-def _initialize_card(db, card, template, summary):
+def _template_maps(template) -> tuple[dict[str, str | None], dict]:
+    """Lookup maps for a template: ({benefit name: key}, {category: entry}).
+
+    The first covers credits and spend thresholds; the second the bonus
+    categories. Both depend only on the template, not on the card.
+    """
+    template_keys: dict[str, str | None] = {}
+    template_cats = {}
+    tb = template.benefits
+    if tb:
+        for credit in tb.credits or ():
+            template_keys[credit.name] = credit.key
+        for threshold in tb.spend_thresholds or ():
+            template_keys[threshold.name] = threshold.key
+        for bc in tb.bonus_categories or ():
+            template_cats[bc.category] = bc
+    return template_keys, template_cats
+
+
+def _initialize_card(card, summary, benefits, existing_cats, template_keys, template_cats):
     """Tag pre-existing benefits/categories as template-sourced.
 
     Deliberately does NOT set template_version_id: the caller runs _sync_card
@@ -83,17 +127,7 @@ def _initialize_card(db, card, template, summary):
     records the version. Marking the version here would declare the card
     reconciled with a template state it never actually received.
     """
-    # Map template display names to their stable keys (if declared).
-    template_keys: dict[str, str | None] = {}
-    if template.benefits and template.benefits.credits:
-        for credit in template.benefits.credits:
-            template_keys[credit.name] = credit.key
-    if template.benefits and template.benefits.spend_thresholds:
-        for threshold in template.benefits.spend_thresholds:
-            template_keys[threshold.name] = threshold.key
-
     # Tag existing benefits that match template credits or thresholds
-    benefits = db.query(CardBenefit).filter(CardBenefit.card_id == card.id).all()
     for benefit in benefits:
         if benefit.benefit_name in template_keys:
             benefit.from_template = True
@@ -101,13 +135,8 @@ def _initialize_card(db, card, template, summary):
                 benefit.template_key = template_keys[benefit.benefit_name]
 
     # Tag existing bonus categories that match template categories
-    template_cat_names = set()
-    if template.benefits and template.benefits.bonus_categories:
-        for bc in template.benefits.bonus_categories:
-            template_cat_names.add(bc.category)
-    existing_cats = db.query(CardBonusCategory).filter(CardBonusCategory.card_id == card.id).all()
     for cat in existing_cats:
-        if cat.category in template_cat_names:
+        if cat.category in template_cats:
             cat.from_template = True
 
     summary["cards_initialized"] += 1
@@ -212,13 +241,16 @@ def _sync_benefit_group(db, card, summary, template_entries, existing, benefit_t
             summary["benefits_retired"] += 1
 
 
-def _sync_card(db, card, template, summary):
-    """Apply template changes to a card: update AF and merge benefits."""
+def _sync_card(db, card, template, summary, benefits, cats, template_cats):
+    """Apply template changes to a card: update AF and merge benefits.
+
+    `benefits` and `cats` are all of the card's benefits and bonus categories;
+    `template_cats` is the category map from _template_maps.
+    """
     # Update annual fee (skip if user manually modified it)
     if template.annual_fee is not None and not card.annual_fee_user_modified:
         card.annual_fee = template.annual_fee
 
-    benefits = db.query(CardBenefit).filter(CardBenefit.card_id == card.id).all()
     credit_benefits = [
         b for b in benefits if b.from_template and b.benefit_type == "credit"
     ]
@@ -239,15 +271,7 @@ def _sync_card(db, card, template, summary):
     )
 
     # Sync bonus categories: add new, remove deleted from_template ones
-    template_cats = {}
-    if template.benefits and template.benefits.bonus_categories:
-        for bc in template.benefits.bonus_categories:
-            template_cats[bc.category] = bc
-
-    existing_cats = db.query(CardBonusCategory).filter(
-        CardBonusCategory.card_id == card.id, CardBonusCategory.from_template == True
-    ).all()
-    existing_cat_map = {c.category: c for c in existing_cats}
+    existing_cat_map = {c.category: c for c in cats if c.from_template}
 
     for name, tbc in template_cats.items():
         if name in existing_cat_map:
@@ -1,8 +1,11 @@
-from datetime import date
+from datetime import date, timedelta
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
 
+_ONE_DAY = timedelta(days=1)
+
 _FREQUENCY_MONTHS = {
     "monthly": 1,
     "quarterly": 3,
@@ -35,7 +38,7 @@ def period_length_months(frequency: str) -> int:
 
 def period_end_for_start(frequency: str, start: date) -> date:
     """The last day of the period beginning at `start`."""
-    return start + relativedelta(months=period_length_months(frequency)) - relativedelta(days=1)
+    return start + relativedelta(months=period_length_months(frequency)) - _ONE_DAY
 
 
 def get_current_period(
@@ -52,6 +55,18 @@ def get_current_period(
     ref = reference_date or date.today()
 
     if reset_type == "cardiversary" and open_date:
+        return _cached_period(frequency, open_date, ref)
+    # open_date is irrelevant to calendar periods; leaving it out of the key
+    # lets every card share one entry per frequency.
+    return _cached_period(frequency, None, ref)
+
+
+# Pure in its arguments (date.today() is resolved by the caller), and list
+# endpoints ask for the same few (frequency, open_date, today) combinations
+# once per benefit row. Results are tuples of immutable dates, safe to share.
+@lru_cache(maxsize=512)
+def _cached_period(frequency: str, open_date: date | None, ref: date) -> tuple[date, date]:
+    if open_date is not None:
         return _cardiversary_period(frequency, open_date, ref)
     return _calendar_period(frequency, ref)
 
@@ -59,15 +74,15 @@ def get_current_period(
 def _calendar_period(frequency: str, ref: date) -> tuple[date, date]:
     if frequency == "monthly":
         start = ref.replace(day=1)
-        end = start + relativedelta(months=1) - relativedelta(days=1)
+        end = start + relativedelta(months=1) - _ONE_DAY
     elif frequency == "quarterly":
         quarter_month = ((ref.month - 1) // 3) * 3 + 1
         start = date(ref.year, quarter_month, 1)
-        end = start + relativedelta(months=3) - relativedelta(days=1)
+        end = start + relativedelta(months=3) - _ONE_DAY
     elif frequency == "semi_annual":
         half_month = 1 if ref.month <= 6 else 7
         start = date(ref.year, half_month, 1)
-        end = start + relativedelta(months=6) - relativedelta(days=1)
+        end = start + relativedelta(months=6) - _ONE_DAY
     else:  # annual
         start = date(ref.year, 1, 1)
         end = date(ref.year, 12, 31)
@@ -79,7 +94,7 @@ def _cardiversary_period(frequency: str, open_date: date, ref: date) -> tuple[da
 
     # Guard: if open_date is in the future, return the first period immediately
     if open_date > ref:
-        return open_date, nth_anniversary(open_date, months, 1) - relativedelta(days=1)
+        return open_date, nth_anniversary(open_date, months, 1) - _ONE_DAY
 
     # Find n such that ref falls in [origin + n*months, origin + (n+1)*months).
     # Estimate from the month difference, then correct — the estimate can be off
@@ -92,5 +107,5 @@ def _cardiversary_period(frequency: str, open_date: date, ref: date) -> tuple[da
 
     return (
         nth_anniversary(open_date, months, n),
-        nth_anniversary(open_date, months, n + 1) - relativedelta(days=1),
+        nth_anniversary(open_date, months, n + 1) - _ONE_DAY,
     )
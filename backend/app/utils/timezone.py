@@ -3,6 +3,7 @@ from datetime import date, datetime
 
 from sqlalchemy.orm import Session
 
+from app.models.setting import Setting
 from app.models.user_setting import UserSetting
 
 # ZoneInfo raises ValueError -- not KeyError/ZoneInfoNotFoundError -- for keys
@@ -22,8 +23,18 @@ def resolve_timezone(name: str | None) -> zoneinfo.ZoneInfo | None:
         return None
 
 
-def get_today(db: Session, user_id: int | None = None) -> date:
-    """Get today's date in the configured timezone for a user."""
+# Session.info key for the per-session memo of resolved zones. A session lives
+# for one request (get_db), and a single card create or product change asks
+# for "today" several times over, each of which used to cost its own query.
+_TZ_CACHE_KEY = "user_timezones"
+
+
+def forget_timezones(db: Session) -> None:
+    """Drop the session's memoized zones; call after writing a timezone setting."""
+    db.info.pop(_TZ_CACHE_KEY, None)
+
+
+def _user_timezone(db: Session, user_id: int | None) -> zoneinfo.ZoneInfo | None:
     if user_id is not None:
         tz_setting = (
             db.query(UserSetting)
@@ -33,14 +44,25 @@ def get_today(db: Session, user_id: int | None = None) -> date:
         if tz_setting:
             tz = resolve_timezone(tz_setting.value)
             if tz is not None:
-                return datetime.now(tz).date()
+                return tz
 
     # Fallback: check global Setting table for backward compatibility
-    from app.models.setting import Setting
     global_tz = db.get(Setting, "timezone")
     if global_tz:
-        tz = resolve_timezone(global_tz.value)
-        if tz is not None:
-            return datetime.now(tz).date()
+        return resolve_timezone(global_tz.value)
+    return None
+
+
+def get_today(db: Session, user_id: int | None = None) -> date:
+    """Get today's date in the configured timezone for a user.
 
+    The zone is looked up once per session; the date itself is computed on
+    every call, so a memoized zone never serves yesterday's date.
+    """
+    cache = db.info.setdefault(_TZ_CACHE_KEY, {})
+    if user_id not in cache:
+        cache[user_id] = _user_timezone(db, user_id)
+    tz = cache[user_id]
+    if tz is not None:
+        return datetime.now(tz).date()
     return date.today()
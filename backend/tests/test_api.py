@@ -92,6 +92,35 @@ def test_create_card(client, auth_headers):
     assert "opened" in event_types
 
 
+def test_card_responses_match_validated_schema(client, auth_headers, db_session):
+    """The unvalidated fast path must render exactly what from_attributes
+    validation would, nested events and bonuses included."""
+    from app.models.card import Card
+    from app.schemas.card import CardOut
+
+    profile = client.post("/api/profiles", json={"name": "Fast"}, headers=auth_headers).json()
+    card = client.post("/api/cards", json={
+        "profile_id": profile["id"],
+        "card_name": "American Express Gold Card",
+        "issuer": "American Express",
+        "template_id": "amex/gold",
+        "open_date": "2023-03-10",
+        "custom_tags": ["dining"],
+    }, headers=auth_headers).json()
+    client.post(f"/api/cards/{card['id']}/bonuses", json={
+        "bonus_source": "retention", "bonus_amount": 20000, "bonus_type": "points",
+    }, headers=auth_headers)
+
+    row = db_session.get(Card, card["id"])
+    expected = CardOut.model_validate(row).model_dump(mode="json")
+    assert CardOut.from_orm_fast(row).model_dump(mode="json") == expected
+    assert expected["bonuses"] and expected["events"]
+
+    assert client.get(f"/api/cards/{card['id']}", headers=auth_headers).json() == expected
+    listed = client.get("/api/cards", params={"profile_id": profile["id"]}, headers=auth_headers).json()
+    assert listed == [expected]
+
+
 def test_close_card(client, auth_headers):
     profile = client.post("/api/profiles", json={"name": "Test"}, headers=auth_headers).json()
     card = client.post("/api/cards", json={
@@ -243,6 +272,75 @@ def test_templates_endpoint(client):
     assert isinstance(response.json(), list)
 
 
+def test_templates_endpoint_issuer_filter_is_case_insensitive(client):
+    """The issuer index is keyed on the lowercased issuer, built at load time."""
+    everything = client.get("/api/templates").json()
+    expected = [t["id"] for t in everything if t["issuer"].lower() == "chase"]
+    assert expected
+
+    for issuer in ("chase", "Chase", "CHASE"):
+        resp = client.get("/api/templates", params={"issuer": issuer})
+        assert resp.status_code == 200
+        assert [t["id"] for t in resp.json()] == expected
+
+    assert client.get("/api/templates", params={"issuer": "no-such-bank"}).json() == []
+
+
+def test_templates_endpoint_serves_cached_json_with_etag(client):
+    """The pre-serialized list must match what the models would render, and a
+    matching If-None-Match short-circuits to 304."""
+    from app.services.template_loader import get_all_templates
+
+    resp = client.get("/api/templates")
+    assert resp.json() == [t.model_dump(mode="json") for t in get_all_templates()]
+    etag = resp.headers["etag"]
+    assert etag
+    # Browsers must revalidate, or they keep showing a catalog replaced by a reload.
+    assert resp.headers["cache-control"] == "no-cache"
+
+    cached = client.get("/api/templates", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["cache-control"] == "no-cache"
+
+    by_issuer = client.get("/api/templates", params={"issuer": "chase"})
+    assert by_issuer.headers["etag"] != etag
+    stale = client.get("/api/templates", params={"issuer": "chase"}, headers={"If-None-Match": etag})
+    assert stale.status_code == 200
+
+
+def test_template_image_supports_ranges_and_revalidation(client):
+    full = client.get("/api/templates/amex/platinum/image")
+    assert full.status_code == 200
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["cache-control"] == "no-cache"
+    etag = full.headers["etag"]
+
+    partial = client.get("/api/templates/amex/platinum/image", headers={"Range": "bytes=0-9"})
+    assert partial.status_code == 206
+    assert partial.content == full.content[:10]
+
+    cached = client.get("/api/templates/amex/platinum/image", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    variant = client.get("/api/templates/amex/platinum/image/card.png", headers={"If-None-Match": etag})
+    assert variant.status_code == 304
+
+
+def test_template_etag_matching_is_per_tag(client):
+    etag = client.get("/api/templates").headers["etag"]
+
+    def status(if_none_match):
+        return client.get("/api/templates", headers={"If-None-Match": if_none_match}).status_code
+
+    assert status(f'"other", W/{etag}') == 304
+    assert status("*") == 304
+    # A tag that merely contains ours as a substring is a different tag.
+    assert status(f'"x{etag[1:-1]}x"') == 200
+    assert status(etag[1:-1]) == 200
+
+
 def _create_card_with_benefit(client, auth_headers):
     """Helper: create a profile + card and add a benefit."""
     profile = client.post("/api/profiles", json={"name": "BenefitTest"}, headers=auth_headers).json()
@@ -278,6 +376,33 @@ def test_create_and_list_benefit(client, auth_headers):
     assert len(resp.json()) == 1
 
 
+def test_benefit_summary_carries_card_context(client, auth_headers):
+    """The dashboard summary renders every schema field, benefit and card."""
+    from app.schemas.card_benefit import BenefitSummaryItem
+
+    card = _create_card_with_benefit(client, auth_headers)
+    benefit = client.post(f"/api/cards/{card['id']}/benefits", json={
+        "benefit_name": "Dining Credit",
+        "benefit_amount": 10,
+        "frequency": "monthly",
+    }, headers=auth_headers).json()
+
+    resp = client.get("/api/benefits", params={"profile_id": card["profile_id"]}, headers=auth_headers)
+    assert resp.status_code == 200
+    [item] = resp.json()
+    assert set(item) == set(BenefitSummaryItem.model_fields)
+    assert {k: item[k] for k in benefit} == benefit
+    assert item["card_name"] == "Test Card"
+    assert item["profile_name"] == "BenefitTest"
+
+
+def test_reset_label_format():
+    from app.services.benefit_service import _make_reset_label
+
+    assert _make_reset_label(date(2025, 3, 9), "calendar") == "Resets Mar 9"
+    assert _make_reset_label(date(2025, 12, 31), "cardiversary") == "Resets Dec 31 (cardiversary)"
+
+
 def test_update_benefit(client, auth_headers):
     card = _create_card_with_benefit(client, auth_headers)
     benefit = client.post(f"/api/cards/{card['id']}/benefits", json={
@@ -358,6 +483,63 @@ def test_period_reset_on_read(client, auth_headers):
     assert len(benefits) == 1
     assert benefits[0]["amount_used"] == 0  # Reset!
 
+    # ...and the reset is written back, not just rendered.
+    db.expire_all()
+    b = db.get(CardBenefit, benefit["id"])
+    assert b.amount_used == 0
+    assert b.period_start == date.fromisoformat(benefits[0]["period_start"])
+
+
+def test_benefit_reads_do_not_commit_when_nothing_lapsed(client, auth_headers):
+    """Listing benefits that are all in their current period is read-only."""
+    from sqlalchemy import event
+
+    from tests.conftest import engine
+
+    card = _create_card_with_benefit(client, auth_headers)
+    client.post(f"/api/cards/{card['id']}/benefits", json={
+        "benefit_name": "Dining Credit", "benefit_amount": 10, "frequency": "monthly",
+    }, headers=auth_headers)
+
+    commits = []
+    listener = lambda conn: commits.append(conn)  # noqa: E731
+    event.listen(engine, "commit", listener)
+    try:
+        assert len(client.get(f"/api/cards/{card['id']}/benefits", headers=auth_headers).json()) == 1
+        assert len(client.get("/api/benefits", headers=auth_headers).json()) == 1
+    finally:
+        event.remove(engine, "commit", listener)
+    assert commits == []
+
+
+def test_summary_period_reset_is_persisted(client, auth_headers, db_session):
+    """The dashboard summary resets lapsed periods in the database too, and
+    leaves current ones alone."""
+    from app.models.card_benefit import CardBenefit
+
+    card = _create_card_with_benefit(client, auth_headers)
+    ids = []
+    for name in ("Stale", "Current"):
+        b = client.post(f"/api/cards/{card['id']}/benefits", json={
+            "benefit_name": name, "benefit_amount": 10, "frequency": "monthly",
+        }, headers=auth_headers).json()
+        client.put(f"/api/cards/{card['id']}/benefits/{b['id']}/usage", json={
+            "amount_used": 8,
+        }, headers=auth_headers)
+        ids.append(b["id"])
+    stale = db_session.get(CardBenefit, ids[0])
+    stale.period_start = date(2020, 1, 1)
+    db_session.commit()
+
+    summary = client.get("/api/benefits", headers=auth_headers).json()
+    used = {b["benefit_name"]: b["amount_used"] for b in summary}
+    assert used == {"Stale": 0, "Current": 8}
+
+    db_session.expire_all()
+    current_start = db_session.get(CardBenefit, ids[1]).period_start
+    stale = db_session.get(CardBenefit, ids[0])
+    assert (stale.amount_used, stale.period_start) == (0, current_start)
+
 
 def test_auto_populate_from_template(client, auth_headers):
     """Creating a card from a template with credits should auto-create benefits."""
@@ -416,6 +598,25 @@ def test_populate_endpoint(client, auth_headers):
     assert len(all_benefits) == 12  # still the same
 
 
+def test_populate_response_matches_stored_benefits(client, auth_headers):
+    """Populated benefits are rendered before commit; they must match what a
+    later read returns, ids and defaults included."""
+    profile = client.post("/api/profiles", json={"name": "PopulateTest"}, headers=auth_headers).json()
+    card = client.post("/api/cards", json={
+        "profile_id": profile["id"],
+        "card_name": "American Express Platinum Card",
+        "issuer": "Amex",
+        "template_id": "amex/platinum",
+        "open_date": "2024-01-01",
+    }, headers=auth_headers).json()
+    for b in client.get(f"/api/cards/{card['id']}/benefits", headers=auth_headers).json():
+        client.delete(f"/api/cards/{card['id']}/benefits/{b['id']}", headers=auth_headers)
+
+    populated = client.post(f"/api/cards/{card['id']}/benefits/populate", headers=auth_headers).json()
+    stored = client.get(f"/api/cards/{card['id']}/benefits", headers=auth_headers).json()
+    assert sorted(populated, key=lambda b: b["id"]) == sorted(stored, key=lambda b: b["id"])
+
+
 def test_auto_populate_sets_from_template(client, auth_headers):
     """Benefits auto-created from template should have from_template=True."""
     profile = client.post("/api/profiles", json={"name": "FromTemplateTest"}, headers=auth_headers).json()
@@ -764,6 +965,54 @@ def test_version_aware_af_uses_old_fee(client, auth_headers):
     assert af_events[3]["metadata_json"]["annual_fee"] == 895
 
 
+def test_fee_timeline_is_memoized_until_templates_reload():
+    from app.services import template_loader
+    from app.services.card_service import _build_fee_timeline, _get_fee_for_year
+
+    timeline = _build_fee_timeline("amex/platinum")
+    assert _get_fee_for_year(timeline, 2021) == 695
+    assert _get_fee_for_year(timeline, 2024) == 695
+    assert _get_fee_for_year(timeline, 2030) == 895
+    # Before the first known version: the oldest fee.
+    assert _get_fee_for_year(timeline, 1990) == 550
+    assert _build_fee_timeline("amex/platinum") is timeline
+
+    template_loader.load_templates()
+    rebuilt = _build_fee_timeline("amex/platinum")
+    assert rebuilt is not timeline
+    assert rebuilt == timeline
+
+
+def test_template_reload_reparses_only_changed_files(monkeypatch, tmp_path):
+    from app.config import settings
+    from app.services import template_loader
+
+    for name in ("one", "two"):
+        card_dir = tmp_path / "bank" / name
+        card_dir.mkdir(parents=True)
+        (card_dir / "card.yaml").write_text(f"name: {name.title()}\n")
+    parsed = []
+    real_load = template_loader.yaml.load
+    monkeypatch.setattr(
+        template_loader.yaml, "load", lambda f, Loader: parsed.append(f.name) or real_load(f, Loader=Loader)
+    )
+    monkeypatch.setattr(settings, "card_templates_dir", str(tmp_path))
+    try:
+        template_loader.load_templates()
+        assert len(parsed) == 2
+
+        changed = tmp_path / "bank" / "two" / "card.yaml"
+        changed.write_text("name: Two Updated\n")
+        parsed.clear()
+        template_loader.load_templates()
+        assert parsed == [str(changed)]
+        assert template_loader.get_template("bank/one").name == "One"
+        assert template_loader.get_template("bank/two").name == "Two Updated"
+    finally:
+        monkeypatch.undo()
+        template_loader.load_templates()
+
+
 def test_af_fallback_no_template(client, auth_headers):
     """Card without template_id should use flat annual_fee for all AF events."""
     profile = client.post("/api/profiles", json={"name": "NoTemplateAFTest"}, headers=auth_headers).json()
@@ -1313,6 +1562,42 @@ def test_set_timezone(client, auth_headers):
     assert resp.json()["timezone"] == "America/New_York"
 
 
+def test_set_timezone_twice_updates_the_same_row(client, auth_headers, db_session):
+    """The upsert overwrites in place rather than adding a second row."""
+    from app.models.user_setting import UserSetting
+
+    client.put("/api/settings", json={"timezone": "America/New_York"}, headers=auth_headers)
+    resp = client.put("/api/settings", json={"timezone": "Europe/Paris"}, headers=auth_headers)
+    assert resp.json()["timezone"] == "Europe/Paris"
+
+    rows = db_session.query(UserSetting).filter(UserSetting.key == "timezone").all()
+    assert [r.value for r in rows] == ["Europe/Paris"]
+
+
+def test_get_today_memoizes_the_zone_per_session(client, auth_headers, db_session):
+    """The zone is read once per session until a timezone write clears it."""
+    import zoneinfo
+
+    from app.models.user import User
+    from app.models.user_setting import UserSetting
+    from app.utils.timezone import forget_timezones, get_today
+
+    # UTC+14 and UTC-11 are never on the same calendar date.
+    ahead, behind = "Pacific/Kiritimati", "Pacific/Pago_Pago"
+    client.put("/api/settings", json={"timezone": ahead}, headers=auth_headers)
+    user_id = db_session.query(User.id).scalar()
+    today_ahead = datetime.now(zoneinfo.ZoneInfo(ahead)).date()
+    assert get_today(db_session, user_id) == today_ahead
+
+    row = db_session.query(UserSetting).filter(UserSetting.key == "timezone").one()
+    row.value = behind
+    db_session.commit()
+    assert get_today(db_session, user_id) == today_ahead
+
+    forget_timezones(db_session)
+    assert get_today(db_session, user_id) == datetime.now(zoneinfo.ZoneInfo(behind)).date()
+
+
 def test_invalid_timezone_rejected(client, auth_headers):
     """Setting an invalid timezone should be rejected."""
     resp = client.put("/api/settings", json={"timezone": "Invalid/FakeZone"}, headers=auth_headers)
@@ -1378,6 +1663,18 @@ def test_reject_long_tag(client, auth_headers):
     assert resp.status_code == 422
 
 
+def test_clean_custom_tags_fast_path():
+    """Already-clean tag lists come back untouched; anything else is rebuilt."""
+    from app.schemas.card import clean_custom_tags
+
+    tags = ["Travel", "dining"]
+    assert clean_custom_tags(tags) is tags
+    assert clean_custom_tags(None) is None
+    assert clean_custom_tags([]) is None
+    assert clean_custom_tags(["Travel", "travel"]) == ["Travel"]
+    assert clean_custom_tags([" Travel ", ""]) == ["Travel"]
+
+
 def test_reject_long_benefit_name(client, auth_headers):
     """Benefit name exceeding max length should be rejected."""
     card = _create_card_with_benefit(client, auth_headers)
@@ -2133,6 +2430,81 @@ def test_export_import_with_bonuses(client, auth_headers):
     result = import_response.json()
     assert result["bonuses_imported"] == 1
 
+    # The imported bonus still points at the imported product-change event.
+    everything = client.get("/api/profiles/export", headers=auth_headers).json()
+    imported_card = everything["profiles"][-1]["cards"][0]
+    linked = [
+        e for e in imported_card["events"]
+        if e["original_id"] == imported_card["bonuses"][0]["event_id"]
+    ]
+    assert [e["event_type"] for e in linked] == ["product_change"]
+
+
+def test_export_skips_soft_deleted_cards(client, auth_headers):
+    profile = client.post("/api/profiles", json={"name": "Trash"}, headers=auth_headers).json()
+    for name in ("Kept", "Deleted"):
+        card = client.post("/api/cards", json={
+            "profile_id": profile["id"], "card_name": name, "issuer": "Chase", "open_date": "2024-01-01",
+        }, headers=auth_headers).json()
+    client.delete(f"/api/cards/{card['id']}", headers=auth_headers)
+
+    exported = client.get(f"/api/profiles/export?profile_id={profile['id']}", headers=auth_headers).json()
+    assert [c["card_name"] for c in exported["profiles"][0]["cards"]] == ["Kept"]
+
+
+def test_export_bytes_match_pydantic_serialization(client, auth_headers):
+    """The hand-built export serializes exactly as ExportData would."""
+    from app.schemas.export_import import EXPORT_DATA_ADAPTER
+
+    profile = client.post("/api/profiles", json={"name": "Parity"}, headers=auth_headers).json()
+    client.post("/api/cards", json={
+        "profile_id": profile["id"],
+        "template_id": "amex/platinum",
+        "card_name": "Platinum",
+        "issuer": "American Express",
+        "open_date": "2024-07-01",
+        "annual_fee": 695,
+        "custom_tags": ["travel"],
+    }, headers=auth_headers)
+    client.put("/api/settings", json={"timezone": "America/New_York"}, headers=auth_headers)
+
+    r = client.get("/api/profiles/export", headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["exported_at"].endswith("Z")
+    assert EXPORT_DATA_ADAPTER.dump_json(EXPORT_DATA_ADAPTER.validate_json(r.content)) == r.content
+
+
+def test_import_links_bonuses_to_their_own_cards_events(client, auth_headers):
+    cards = [
+        {
+            "card_name": name,
+            "issuer": "Amex",
+            "events": [
+                {"original_id": 1, "event_type": "opened", "event_date": "2024-01-01"},
+                {"original_id": 2, "event_type": "product_change", "event_date": "2025-01-01",
+                 "description": f"PC {name}"},
+            ],
+            "bonuses": [{"bonus_source": "upgrade", "event_id": 2, "description": name}],
+        }
+        for name in ("Gold", "Green", "Platinum")
+    ]
+    r = client.post("/api/profiles/import?mode=new", json={
+        "version": 1,
+        "exported_at": "2026-01-01T00:00:00Z",
+        "profiles": [{"name": "Linked", "cards": cards}],
+    }, headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["events_imported"] == 6
+
+    exported = client.get("/api/profiles/export", headers=auth_headers).json()
+    imported = next(p for p in exported["profiles"] if p["name"] == "Linked")
+    assert [c["card_name"] for c in imported["cards"]] == ["Gold", "Green", "Platinum"]
+    for card in imported["cards"]:
+        bonus = card["bonuses"][0]
+        assert bonus["description"] == card["card_name"]
+        linked = next(e for e in card["events"] if e["original_id"] == bonus["event_id"])
+        assert linked["description"] == f"PC {card['card_name']}"
+
 
 # ── Retention Offer Tests ────────────────────────────────────────────
 
@@ -2392,6 +2764,34 @@ def test_export_import_override_bonuses_count(client, auth_headers):
     assert result["cards_imported"] == 1
 
 
+def test_override_import_replaces_loaded_cards_and_children(db_session):
+    """Cards deleted in bulk don't leave stale instances behind in the session."""
+    from app.models.card import Card
+    from app.models.card_benefit import CardBenefit
+    from app.models.profile import Profile
+    from app.services.export_import import import_profiles
+
+    profile = Profile(name="Override")
+    db_session.add(profile)
+    db_session.flush()
+    card = Card(profile_id=profile.id, card_name="Old", issuer="Amex")
+    card.benefits.append(CardBenefit(benefit_name="Old credit", benefit_amount=10, frequency="monthly"))
+    db_session.add(card)
+    db_session.flush()
+    benefit_id = card.benefits[0].id
+
+    data = ExportData(exported_at=datetime.now(timezone.utc), profiles=[ExportProfile(name="Override", cards=[
+        ExportCard(card_name="New", issuer="Chase", benefits=[
+            ExportBenefit(benefit_name="New credit", benefit_amount=20, frequency="annual"),
+        ]),
+    ])])
+    result = import_profiles(db_session, data, "override", profile.id)
+
+    assert result.cards_imported == 1
+    assert [c.card_name for c in profile.cards] == ["New"]
+    assert db_session.get(CardBenefit, benefit_id).benefit_name == "New credit"
+
+
 def test_multiple_retention_offers_on_same_card(client, auth_headers):
     """Multiple retention offers on the same card are tracked independently."""
     profile = client.post("/api/profiles", json={"name": "MultiRet"}, headers=auth_headers).json()
@@ -2484,6 +2884,30 @@ def test_reopen_card_restores_af_tracking(client, auth_headers):
     assert len(reopened_events) == 1
 
 
+def test_reopen_card_backfills_only_missing_af_events(client, auth_headers):
+    profile = client.post("/api/profiles", json={"name": "Test"}, headers=auth_headers).json()
+    card = client.post("/api/cards", json={
+        "profile_id": profile["id"],
+        "card_name": "Platinum",
+        "issuer": "Amex",
+        "open_date": (date.today() - relativedelta(years=4)).isoformat(),
+        "annual_fee": 695,
+    }, headers=auth_headers).json()
+    af = sorted(
+        (e for e in card["events"] if e["event_type"] == "annual_fee_posted"),
+        key=lambda e: e["event_date"],
+    )
+    assert len(af) >= 4
+    expected_dates = [e["event_date"] for e in af]
+
+    client.post(f"/api/cards/{card['id']}/close", json={"close_date": date.today().isoformat()}, headers=auth_headers)
+    client.delete(f"/api/events/{af[1]['id']}", headers=auth_headers)
+
+    card = client.post(f"/api/cards/{card['id']}/reopen", headers=auth_headers).json()
+    dates = sorted(e["event_date"] for e in card["events"] if e["event_type"] == "annual_fee_posted")
+    assert dates == expected_dates
+
+
 # ── Bonus missed status ──────────────────
 
 
@@ -3847,6 +4271,48 @@ def test_af_helpers_tolerate_missing_open_date(client, setup_complete, auth_head
     assert _next_af_anniversary(None, date(2026, 1, 1)) == date(2027, 1, 1)
 
 
+def test_add_years_matches_relativedelta():
+    from app.services.card_service import _add_years
+
+    for d in (date(2024, 2, 29), date(2023, 3, 31), date(2025, 1, 1)):
+        for n in (-20, -1, 1, 4, 5):
+            assert _add_years(d, n) == d + relativedelta(years=n), (d, n)
+
+
+def test_leap_day_product_change_regenerates_leap_day_anniversaries(db_session):
+    """Anniversaries step from the change date itself, so a Feb 29 product change
+    falls on Feb 28 in common years and back on Feb 29 in leap years, rather
+    than staying on Feb 28 for good after the first clamp."""
+    from app.models.card import Card
+    from app.models.card_event import CardEvent
+    from app.models.profile import Profile
+    from app.services.card_service import _recalculate_af_events_after_change
+
+    profile = Profile(name="LeapPC")
+    db_session.add(profile)
+    db_session.flush()
+    card = Card(
+        profile_id=profile.id, card_name="Leap Card", issuer="Test",
+        card_type="personal", status="active", open_date=date(2020, 1, 1), annual_fee=95,
+    )
+    db_session.add(card)
+    db_session.flush()
+
+    _recalculate_af_events_after_change(db_session, card, date(2024, 2, 29), date(2029, 6, 1))
+    db_session.commit()
+
+    posted = [
+        e.event_date for e in db_session.query(CardEvent)
+        .filter(CardEvent.card_id == card.id, CardEvent.event_type == "annual_fee_posted")
+        .order_by(CardEvent.event_date)
+    ]
+    assert posted == [
+        date(2025, 2, 28), date(2026, 2, 28), date(2027, 2, 28),
+        date(2028, 2, 29), date(2029, 2, 28),
+    ]
+    assert card.annual_fee_date == date(2030, 2, 28)
+
+
 def test_deleting_af_event_on_card_without_open_date(client, setup_complete, auth_headers):
     """End-to-end version of the above."""
     profile = _profile(client, auth_headers)
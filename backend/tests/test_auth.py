@@ -50,6 +50,20 @@ def test_setup_complete_multi_user(client):
     assert r.json()["auth_mode"] == "multi_user"
 
 
+def test_setup_copies_global_settings_to_admin(client, db_session):
+    from app.models.setting import Setting
+    from app.models.user_setting import UserSetting
+
+    db_session.add_all([Setting(key="timezone", value="Asia/Tokyo"), Setting(key="theme", value="dark")])
+    db_session.commit()
+
+    r = client.post("/api/setup/complete", json={"auth_mode": "open"})
+    assert r.status_code == 200
+    admin = db_session.query(User).one()
+    rows = db_session.query(UserSetting.user_id, UserSetting.key, UserSetting.value).order_by(UserSetting.key)
+    assert rows.all() == [(admin.id, "theme", "dark"), (admin.id, "timezone", "Asia/Tokyo")]
+
+
 def test_setup_cannot_run_twice(client, setup_complete):
     """Setup endpoint rejects once already completed."""
     r = client.post("/api/setup/complete", json={
@@ -307,6 +321,20 @@ def test_long_passwords_do_not_500(client):
     assert client.post("/api/auth/login", json={"password": "🎉" * 40}).status_code == 401
 
 
+def test_bcrypt_rounds_setting_applies_to_new_hashes(monkeypatch):
+    from app.config import settings
+    from app.services.auth_service import hash_password, verify_password
+
+    monkeypatch.setattr(settings, "bcrypt_rounds", 4)
+    old_hash = hash_password("pw")
+    monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+    new_hash = hash_password("pw")
+    assert old_hash.startswith("$2b$04$")
+    assert new_hash.startswith("$2b$05$")
+    # Hashes made under a different cost keep verifying.
+    assert verify_password("pw", new_hash) and verify_password("pw", old_hash)
+
+
 # ── Admin User Management ─────────────────────────────────────────────
 
 def test_admin_list_users(client, multi_user_headers):
@@ -315,6 +343,20 @@ def test_admin_list_users(client, multi_user_headers):
     assert len(r.json()) >= 1  # at least the admin user
 
 
+def test_user_payloads_match_validated_schema(client, multi_user_headers, db_session):
+    """The unvalidated fast path renders exactly what from_attributes validation would."""
+    from app.models.user import User
+    from app.schemas.user import UserOut
+
+    expected = [
+        UserOut.model_validate(u).model_dump(mode="json")
+        for u in db_session.query(User).order_by(User.created_at).all()
+    ]
+    assert client.get("/api/admin/users", headers=multi_user_headers).json() == expected
+    me = client.get("/api/users/me", headers=multi_user_headers).json()
+    assert me in expected
+
+
 def test_admin_create_user(client, multi_user_headers):
     r = client.post("/api/admin/users", json={
         "username": "bob",
@@ -958,6 +1000,38 @@ def test_user_oauth_unlink_blocked_in_oauth_mode_even_with_password(client, db_s
     assert "cannot unlink" in r.json()["detail"].lower()
 
 
+def test_user_oauth_unlink_allowed_in_oauth_mode_with_another_link(client, db_session):
+    """The lockout guard counts every link: with a second provider still bound,
+    unlinking one is allowed even in OAuth mode, and only the target goes."""
+    from app.models.oauth_account import OAuthAccount
+    from app.services.setup_service import set_system_config
+
+    token = _setup_multi_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    admin_user = db_session.query(User).filter(User.username == "testadmin").first()
+    for provider, subject in (("github", "12345"), ("google", "g-678")):
+        db_session.add(OAuthAccount(
+            user_id=admin_user.id,
+            provider=provider,
+            provider_user_id=subject,
+            provider_email="admin@test.com",
+        ))
+    set_system_config(db_session, "auth_mode", "multi_user_oauth")
+    db_session.commit()
+
+    r = client.delete("/api/users/me/oauth/github", headers=headers)
+    assert r.status_code == 200
+
+    remaining = client.get("/api/users/me/oauth-accounts", headers=headers).json()
+    assert [a["provider"] for a in remaining] == ["google"]
+
+    r = client.delete("/api/users/me/oauth/google", headers=headers)
+    assert r.status_code == 400
+    r = client.delete("/api/users/me/oauth/github", headers=headers)
+    assert r.status_code == 404
+
+
 def test_admin_create_user_blocked_in_oauth_mode(client, db_session):
     """Admin cannot create password-based users in OAuth mode."""
     from app.models.oauth_account import OAuthAccount
@@ -1134,6 +1208,40 @@ def test_pyjwt_token_roundtrip():
     assert payload["role"] == "admin"
 
 
+def test_tokens_interoperate_with_pyjwt_and_reject_tampering():
+    """The direct HS256 path stays wire-compatible with PyJWT in both
+    directions, and rejects what jwt.decode would."""
+    import time
+
+    import jwt
+
+    from app.config import settings
+    from app.services.auth_service import create_access_token, decode_token
+
+    token = create_access_token(user_id=7, role="user")
+    assert jwt.decode(token, settings.secret_key, algorithms=["HS256"])["sub"] == "7"
+    now = int(time.time())
+    minted = jwt.encode({"sub": "8", "exp": now + 60, "iat": now}, settings.secret_key, algorithm="HS256")
+    assert decode_token(minted)["sub"] == "8"
+
+    def rejected(tok):
+        try:
+            decode_token(tok)
+        except jwt.PyJWTError:
+            return True
+        return False
+
+    header, payload, signature = token.split(".")
+    assert rejected(f"{header}.{payload}.{signature[:-2]}AA")
+    assert rejected(jwt.encode({"sub": "8", "exp": now + 60}, "some-other-key-entirely-0123456789", algorithm="HS256"))
+    assert rejected(jwt.encode({"sub": "8", "exp": now - 1}, settings.secret_key, algorithm="HS256"))
+    assert rejected(jwt.encode({"sub": "8"}, settings.secret_key, algorithm="HS256"))
+    assert rejected(jwt.encode({"sub": "8", "exp": now + 60}, settings.secret_key, algorithm="HS512"))
+    assert rejected(jwt.encode({"sub": "8", "exp": now + 60}, None, algorithm="none"))
+    assert rejected("not-a-token")
+    assert rejected("é.é.é")
+
+
 # ── Close Card Clears Spend Tracking ──────────────────────────────
 
 def test_close_card_clears_spend_tracking(client, auth_headers):
@@ -1601,6 +1709,40 @@ def test_import_rejects_oversized_card_name(client, auth_headers):
     assert resp.status_code == 422
 
 
+def test_import_validation_errors_point_into_the_body(client, auth_headers):
+    """The hand-validated import body reports errors like a declared body parameter."""
+    import_data = {
+        "version": 1,
+        "exported_at": "2026-01-01T00:00:00",
+        "profiles": [{"name": "ImportTest", "cards": [{"card_name": "A" * 201, "issuer": "Chase"}]}],
+    }
+    resp = client.post("/api/profiles/import", json=import_data, headers=auth_headers)
+    assert resp.status_code == 422
+    [err] = resp.json()["detail"]
+    assert err["loc"] == ["body", "profiles", 0, "cards", 0, "card_name"]
+    assert "input" not in err
+
+    resp = client.post(
+        "/api/profiles/import", content=b"{not json",
+        headers={**auth_headers, "Content-Type": "application/json"},
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"][0] == "body"
+
+
+def test_import_size_cap_applies_without_content_length(client, auth_headers, monkeypatch):
+    """A chunked upload has no Content-Length to pre-check; the cap must still hold."""
+    from app.routers import profiles
+
+    monkeypatch.setattr(profiles, "MAX_IMPORT_SIZE", 1024)
+    chunks = iter([b'{"version": 1, "profiles": [', b" " * 2048, b"]}"])
+    resp = client.post(
+        "/api/profiles/import", content=chunks,
+        headers={**auth_headers, "Content-Type": "application/json"},
+    )
+    assert resp.status_code == 413
+
+
 def test_event_update_cannot_change_system_event_type(client, auth_headers):
     """Cannot change a system-managed event type (opened, closed, etc.)."""
     profile = client.post("/api/profiles", json={"name": "Test"}, headers=auth_headers).json()
@@ -2136,6 +2278,34 @@ def test_two_facebook_users_get_distinct_accounts(db_session):
     assert second.role == "user"
 
 
+def test_oauth_returning_user_is_found_by_linked_account(db_session):
+    from app.services.oauth_service import AccountDeactivatedError, find_or_create_user
+
+    info = {"provider_user_id": "77", "username": "returning"}
+    first = find_or_create_user(db_session, "github", info, {"access_token": "a"})
+    again = find_or_create_user(db_session, "github", info, {"access_token": "b"})
+    assert again.id == first.id
+
+    first.is_active = False
+    db_session.commit()
+    with pytest.raises(AccountDeactivatedError):
+        find_or_create_user(db_session, "github", info, {"access_token": "c"})
+
+
+def test_oauth_username_collisions_get_next_free_suffix(db_session):
+    from app.models.user import User
+    from app.services.oauth_service import find_or_create_user
+
+    # "sam_x" shares the prefix but isn't a suffix of "sam"; "Sam_2" collides case-insensitively.
+    db_session.add_all([User(username=n, display_name=n) for n in ("SAM", "sam_1", "Sam_2", "sam_x")])
+    db_session.commit()
+
+    user = find_or_create_user(
+        db_session, "github", {"provider_user_id": "9", "username": "sam"}, {"access_token": "t"}
+    )
+    assert user.username == "sam_3"
+
+
 def test_open_mode_upgrade_requires_bootstrap_token(client):
     """Regression: in `open` mode require_auth returns the first admin without
     checking any credential, so ANY anonymous caller could switch the auth mode
@@ -2260,3 +2430,18 @@ def test_state_is_scoped_to_the_provider_that_issued_it(client, multi_user_heade
     }, headers=multi_user_headers)
     assert r2.status_code == 400
     assert "different provider" in r2.json()["detail"].lower()
+
+
+def test_legacy_secret_key_derivation_follows_secret_rotation(monkeypatch):
+    """The PBKDF2 fallback is cached per SECRET_KEY, not for the process."""
+    from app.config import settings
+    from app.services import crypto
+
+    monkeypatch.setattr(settings, "secret_key", "first-secret")
+    legacy = crypto._get_fernet_pbkdf2().encrypt(b"client-secret").decode()
+    assert crypto.decrypt_value(legacy) == "client-secret"
+    assert crypto._get_fernet_pbkdf2() is crypto._get_fernet_pbkdf2()
+
+    monkeypatch.setattr(settings, "secret_key", "second-secret")
+    with pytest.raises(crypto.DecryptionError):
+        crypto.decrypt_value(legacy)
@@ -260,6 +260,63 @@ def test_leftover_alembic_tmp_does_not_destroy_data(db_path):
 # ── Pre-Alembic (legacy) databases ─────────────────────────────────────────
 
 
+def test_user_settings_unique_restored_and_deduplicated(db_path):
+    """A database whose user_settings lost uq_user_setting (pre-Alembic
+    installs are stamped, not built) must come out of the upgrade unique on
+    (user_id, key) -- the settings upsert depends on it -- keeping the newest
+    of any duplicate rows."""
+    _run(
+        """
+        from alembic import command
+        from app.main import _get_alembic_config
+        command.upgrade(_get_alembic_config(), "c8f1a52d90b7")
+        """,
+        CONNECT,
+        SEED,
+        db_path=db_path,
+    )
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        PRAGMA foreign_keys=OFF;
+        DROP TABLE user_settings;
+        CREATE TABLE user_settings (
+            id INTEGER NOT NULL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            key VARCHAR(100) NOT NULL,
+            value TEXT NOT NULL
+        );
+        CREATE INDEX ix_user_settings_user_id ON user_settings (user_id);
+        INSERT INTO user_settings (user_id, key, value) VALUES (1, 'timezone', 'UTC');
+        INSERT INTO user_settings (user_id, key, value) VALUES (1, 'timezone', 'Asia/Tokyo');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    out = _run(
+        MIGRATE,
+        CONNECT,
+        """
+        rows = db.execute(text("SELECT value FROM user_settings")).fetchall()
+        print("rows=%s" % [r[0] for r in rows])
+        try:
+            db.execute(text(
+                "INSERT INTO user_settings (user_id, key, value) VALUES (1, 'timezone', 'UTC')"
+            ))
+            db.commit()
+            print("duplicate_rejected=False")
+        except Exception:
+            db.rollback()
+            print("duplicate_rejected=True")
+        """,
+        db_path=db_path,
+    )
+    assert "rows=['Asia/Tokyo']" in out, f"duplicates not collapsed to the newest row:\n{out}"
+    assert "duplicate_rejected=True" in out, f"user_settings still accepts duplicates:\n{out}"
+
+
 def test_legacy_last_four_rename(db_path):
     """Regression: `_run_legacy_migrations` snapshots the column set once, then
     adds `last_digits` AND re-tests that stale snapshot for the rename — so it
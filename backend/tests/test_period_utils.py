@@ -165,3 +165,22 @@ def test_cardiversary_on_boundary():
     )
     assert start == date(2025, 6, 1)
     assert end == date(2026, 5, 31)
+
+
+# --- Memoization ---
+
+def test_calendar_period_ignores_open_date_and_is_cached():
+    ref = date(2025, 3, 15)
+    plain = get_current_period("monthly", "calendar", reference_date=ref)
+    with_open = get_current_period("monthly", "calendar", date(2021, 7, 9), ref)
+    assert plain == with_open == (date(2025, 3, 1), date(2025, 3, 31))
+    # Same cache entry, not merely an equal result.
+    assert plain is with_open
+
+
+def test_cached_cardiversary_period_depends_on_reference_date():
+    open_date = date(2024, 1, 31)
+    before = get_current_period("monthly", "cardiversary", open_date, date(2025, 2, 27))
+    after = get_current_period("monthly", "cardiversary", open_date, date(2025, 2, 28))
+    assert before == (date(2025, 1, 31), date(2025, 2, 27))
+    assert after == (date(2025, 2, 28), date(2025, 3, 30))
@@ -466,3 +466,56 @@ def test_user_renamed_bonus_category_is_not_deleted(db_session):
     sync_cards_to_templates(db_session)
 
     assert db_session.get(CardBonusCategory, cat_id) is not None, "user-renamed category deleted"
+
+
+def test_first_sync_does_not_duplicate_an_existing_matching_category(db_session):
+    """_initialize_card tags a matching category in memory only (autoflush is
+    off); sync used to re-query from_template rows from the DB, miss it, and add
+    the template's copy as a second row."""
+    from app.models.card_bonus_category import CardBonusCategory
+
+    profile = _make_profile(db_session)
+    card = _make_card(db_session, profile.id, template_version_id=None)
+    tmpl = get_template("amex/platinum")
+    assert tmpl and tmpl.benefits and tmpl.benefits.bonus_categories
+    first = tmpl.benefits.bonus_categories[0]
+    db_session.add(CardBonusCategory(
+        card_id=card.id, category=first.category, multiplier=first.multiplier,
+        from_template=False,
+    ))
+    db_session.commit()
+
+    sync_cards_to_templates(db_session)
+
+    rows = db_session.query(CardBonusCategory).filter(
+        CardBonusCategory.card_id == card.id,
+        CardBonusCategory.category == first.category,
+    ).all()
+    assert len(rows) == 1
+    assert rows[0].from_template
+
+
+def test_sync_keeps_each_cards_benefits_separate(db_session):
+    """Benefits fetched for all cards at once are still merged per card."""
+    profile = _make_profile(db_session)
+    first = _make_card(db_session, profile.id, template_version_id="old_version")
+    second = _make_card(db_session, profile.id, template_version_id="old_version")
+    _make_benefit(db_session, first.id, "Dropped Credit A")
+    _make_benefit(db_session, second.id, "Dropped Credit B")
+    _make_benefit(db_session, second.id, "Uber Cash", amount=1)
+    db_session.commit()
+
+    summary = sync_cards_to_templates(db_session)
+    assert summary["cards_synced"] == 2
+    assert summary["benefits_retired"] == 2
+    assert summary["benefits_updated"] == 1
+
+    def live(card):
+        return sorted(
+            b.benefit_name for b in db_session.query(CardBenefit).filter(
+                CardBenefit.card_id == card.id, CardBenefit.retired == False  # noqa: E712
+            )
+        )
+
+    assert live(first) == live(second)
+    assert "Uber Cash" in live(first)